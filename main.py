@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from typing import AsyncGenerator, Any
-from random import choice
+from typing import AsyncGenerator, Any, Callable
+import asyncio
+import time
+from random import Random
+from functools import lru_cache
+from pathlib import Path
 import base64
 import gradio as gr
 from string import Template
@@ -14,10 +18,108 @@ from src.config import GradioConfig
 from src.models.schemas import AgentSource
 
 ChatHistory = list[dict[str, str]]
-GradioOutputs = tuple[gr.Textbox | dict[Any, Any], ChatHistory | dict[Any, Any], ChatHistory | dict[Any, Any], dict[int, str]]
+GradioOutputs = tuple[gr.Textbox | dict[Any, Any], ChatHistory | dict[Any, Any], dict[int, str] | dict[Any, Any]]
 
 langfuse = Langfuse()
 
+_THINKING_MESSAGES: tuple[str, ...] = (
+    "🤔 Let me think about that...",
+    "💭 Gathering information...",
+    "📚 Checking my knowledge base...",
+    "⚡ Processing your question...",
+)
+_rng = Random()
+_background_tasks: set[asyncio.Task[Any]] = set()
+
+# Agents whose outputs are kept in the conversation history
+_CONVERSATION_SOURCES = frozenset(
+    {AgentSource.ORCHESTRATOR, AgentSource.PROFESSIONAL_INFO, AgentSource.PUBLIC_PERSONA}
+)
+
+_INTRO = """
+            Welcome 👋
+
+            Responses are grounded in verified sources, delivered through a multi-agent interactive chatbot, and transparently traced.
+
+            You can ask about:
+            - Technical skills
+            - Project details
+            - Career background and professional focus
+            - Hobbies and interests
+            """
+
+_EXAMPLES: tuple[str, ...] = (
+    "Introduce Sanath in a few short sentences.",
+    "What was his final grade in his master's program?",
+    "Summarize his generative AI work and list the tools used.",
+    "Show me a card trick.",
+    "How can I contact Sanath?",
+)
+
+
+def _run_in_background(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+    """Run a blocking call in a worker thread without awaiting it.
+
+    Must be called from a running event loop. A reference to the task is
+    kept until it finishes so it is not garbage collected early.
+
+    Args:
+        fn: Blocking function to run.
+        *args: Positional arguments for ``fn``.
+        **kwargs: Keyword arguments for ``fn``.
+    """
+    task = asyncio.get_running_loop().create_task(asyncio.to_thread(fn, *args, **kwargs))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def _trim_history(conversation: ChatHistory, max_messages: int) -> None:
+    """Drop the oldest messages so the history fits in a sliding window.
+
+    The window always starts at a user message so every kept agent
+    output is preceded by the question it answers.
+
+    Args:
+        conversation: Conversation history, trimmed in place.
+        max_messages: Maximum number of messages to keep.
+    """
+    if len(conversation) <= max_messages:
+        return
+    start = len(conversation) - max_messages
+    while start < len(conversation) and conversation[start]["role"] != "user":
+        start += 1
+    del conversation[:start]
+
+
+@lru_cache(maxsize=4)
+def _image_data_uri(image_path: Path) -> str:
+    """Encode an image as a base64 data URI, once per path.
+
+    Args:
+        image_path: Path to the PNG image.
+
+    Returns:
+        The data URI, or an empty string if the image does not exist.
+    """
+    if not image_path.exists():
+        return ""
+    image_data = base64.b64encode(image_path.read_bytes()).decode("ascii")
+    return f"data:image/png;base64,{image_data}"
+
+
+@lru_cache(maxsize=4)
+def _read_static_text(path: Path) -> str:
+    """Read a static UI file, once per path.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        The file contents.
+    """
+    return path.read_text(encoding="utf-8")
+
+
 class ChatbotUI:
     """Manages the Gradio UI for the portfolio chatbot."""
 
@@ -30,12 +132,52 @@ class ChatbotUI:
         """
         self.config = config or GradioConfig()
         self.agent = agent
+        self._header_html = Template(_read_static_text(self.config.header_html_path)).safe_substitute(
+            image_src=_image_data_uri(self.config.image_path)
+        )
+        self._footer_html = _read_static_text(self.config.footer_html_path)
+        # Agent conversation histories and last activity time, keyed by session hash
+        self._sessions: dict[str, ChatHistory] = {}
+        self._last_seen: dict[str, float] = {}
+
+    def _get_conversation(self, session_id: str) -> ChatHistory:
+        """Return a session's conversation history and evict idle sessions.
+
+        Args:
+            session_id: Gradio session hash.
+
+        Returns:
+            The session's conversation history, created if missing.
+        """
+        now = time.monotonic()
+        cutoff = now - self.config.session_ttl
+        for idle in [sid for sid, seen in self._last_seen.items() if seen < cutoff]:
+            self._drop_session(idle)
+        self._last_seen[session_id] = now
+        return self._sessions.setdefault(session_id, [])
+
+    def _drop_session(self, session_id: str) -> None:
+        """Forget a session's conversation history.
+
+        Args:
+            session_id: Gradio session hash.
+        """
+        self._sessions.pop(session_id, None)
+        self._last_seen.pop(session_id, None)
+
+    def end_session(self, request: gr.Request) -> None:
+        """Drop the conversation history when a browser session closes.
+
+        Args:
+            request: Gradio Request object identifying the session.
+        """
+        if request.session_hash:
+            self._drop_session(request.session_hash)
 
     async def stream_response(
         self,
         prompt: str,
         chatbot: ChatHistory,
-        conversation: ChatHistory,
         trace_ids: dict[int, str],
         request: gr.Request,
     ) -> AsyncGenerator[GradioOutputs, None]:
@@ -44,47 +186,56 @@ class ChatbotUI:
         Args:
             prompt: User input message.
             chatbot: Chat history for display in the UI.
-            conversation: Full conversation history for the agent.
             trace_ids: Dictionary of trace ids for tracing human feedback.
             request: Gradio Request object to generate session ids.
 
         Yields:
-            Tuple of (textbox state, chatbot history, conversation history).
+            Tuple of (textbox state, chatbot history, trace ids).
         """
         session_id = request.session_hash
         with langfuse.start_as_current_span(name="process_query", input={"user_query": prompt}, end_on_exit=True) as root_span:
             with propagate_attributes(session_id=session_id):
                 if not prompt or not prompt.strip():
                     chatbot.append({"role": "assistant", "content": "Please enter a question."})
-                    yield gr.Textbox(interactive=True, value=""), chatbot, conversation, trace_ids
+                    yield gr.Textbox(interactive=True, value=""), chatbot, trace_ids
                     return
 
                 # Show user message
                 chatbot.append({"role": "user", "content": prompt})
-                yield gr.Textbox(interactive=False, value=""), chatbot, gr.skip(), gr.skip()
+                yield gr.Textbox(interactive=False, value=""), chatbot, gr.skip()
                 
                 # Disable input and update UI
-                thinking_messages = [
-                    "🤔 Let me think about that...",
-                    "💭 Gathering information...",
-                    "📚 Checking my knowledge base...",
-                    "⚡ Processing your question..."
-                ]
-                chatbot.append({"role": "assistant", "content": choice(thinking_messages)})
-                yield gr.skip(), chatbot, gr.skip(), gr.skip()
+                chatbot.append({"role": "assistant", "content": _rng.choice(_THINKING_MESSAGES)})
+                yield gr.skip(), chatbot, gr.skip()
                 
                 # Stream response chunks
                 chatbot[-1]["content"] = ""
+                conversation = self._get_conversation(session_id)
                 conversation.append({"role": "user", "content": prompt})
-                final_response = ""
+                parts: list[str] = []
+                pending_chars = 0
+                loop = asyncio.get_running_loop()
+                last_flush = loop.time()
                 async for event in self.agent.process_query(prompt, conversation):
-                    match event.from_:
-                        case AgentSource.ORCHESTRATOR | AgentSource.PROFESSIONAL_INFO | AgentSource.PUBLIC_PERSONA:
-                            conversation.append({"role": "assistant", "content": event.output})
-                        case AgentSource.FINAL_PRESENTATION:
-                            final_response += event.output
-                            chatbot[-1]["content"] += event.output
-                            yield gr.skip(), chatbot, gr.skip(), gr.skip()
+                    source = event.from_
+                    if source is AgentSource.FINAL_PRESENTATION:
+                        parts.append(event.output)
+                        pending_chars += len(event.output)
+                        now = loop.time()
+                        if (
+                            now - last_flush >= self.config.stream_flush_interval
+                            or pending_chars >= self.config.stream_flush_chars
+                        ):
+                            last_flush = now
+                            pending_chars = 0
+                            chatbot[-1]["content"] = "".join(parts)
+                            yield gr.skip(), chatbot, gr.skip()
+                    elif source in _CONVERSATION_SOURCES:
+                        conversation.append({"role": "assistant", "content": event.output})
+                final_response = "".join(parts)
+                chatbot[-1]["content"] = final_response
+                if pending_chars:
+                    yield gr.skip(), chatbot, gr.skip()
                 
                 # Keep track of trace ids
                 trace_id = langfuse.get_current_trace_id()
@@ -92,9 +243,10 @@ class ChatbotUI:
                     trace_ids[len(chatbot) - 1] = trace_id
                     
                 conversation.append({"role": "assistant", "content": final_response})
+                _trim_history(conversation, self.config.max_history)
                 
                 # Re-enable input
-                yield gr.Textbox(interactive=True), gr.skip(), conversation, trace_ids
+                yield gr.Textbox(interactive=True), gr.skip(), trace_ids
                 
             root_span.update(output=final_response)
 
@@ -107,7 +259,6 @@ class ChatbotUI:
         with gr.Blocks(title="Sanath's Portfolio") as demo:
             self._add_header()
             
-            conversation = gr.State([])
             trace_ids = gr.State({})
             chatbot = self._create_chatbot()
             prompt = self._create_input()
@@ -117,13 +268,19 @@ class ChatbotUI:
             # Connect event handlers
             prompt.submit(
                 self.stream_response,
-                inputs=[prompt, chatbot, conversation, trace_ids],
-                outputs=[prompt, chatbot, conversation, trace_ids],
-                show_progress="full"
+                inputs=[prompt, chatbot, trace_ids],
+                outputs=[prompt, chatbot, trace_ids],
+                show_progress="full",
+                trigger_mode="once",
             )
             chatbot.like(self.handle_like, inputs=trace_ids, outputs=None)
+            demo.unload(self.end_session)
 
-
+        demo.queue(
+            default_concurrency_limit=self.config.concurrency_limit,
+            max_size=self.config.max_queue_size,
+            api_open=False,
+        )
         return demo
 
     def _add_header(self) -> None:
@@ -132,16 +289,7 @@ class ChatbotUI:
         This includes the profile image, title, and subtitle displayed
         at the top of the chatbot interface.
         """
-        image_path = self.config.image_path
-        if image_path.exists():
-            with open(image_path, "rb") as f:
-                image_data = base64.b64encode(f.read()).decode()
-                image_src = f"data:image/png;base64,{image_data}"
-        else:
-            image_src = ""
-        template = Template(self.config.header_html_path.read_text())
-        html = template.safe_substitute(image_src=image_src)
-        gr.HTML(html)
+        gr.HTML(self._header_html)
 
     def _create_chatbot(self) -> gr.Chatbot:
         """Create the chatbot display component.
@@ -149,21 +297,9 @@ class ChatbotUI:
         Returns:
             Configured Gradio Chatbot component.
         """
-        intro = \
-            """
-            Welcome 👋
-
-            Responses are grounded in verified sources, delivered through a multi-agent interactive chatbot, and transparently traced.
-
-            You can ask about:
-            - Technical skills
-            - Project details
-            - Career background and professional focus
-            - Hobbies and interests
-            """
         return gr.Chatbot(
             [
-                {"role": "assistant", "content": intro}
+                {"role": "assistant", "content": _INTRO}
             ],
             label="Sanath’s Portfolio Chatbot",
             avatar_images=(None, self.config.image_path)
@@ -193,13 +329,7 @@ class ChatbotUI:
                 when an example is selected.
         """
         gr.Examples(
-            examples=[
-                "Introduce Sanath in a few short sentences.",
-                "What was his final grade in his master's program?",
-                "Summarize his generative AI work and list the tools used.",
-                "Show me a card trick.",
-                "How can I contact Sanath?"
-            ],
+            examples=list(_EXAMPLES),
             inputs=input_textbox,
         )
         
@@ -209,27 +339,35 @@ class ChatbotUI:
         The footer contains metadata about the chatbot as well as
         external links (GitHub and LinkedIn).
         """
-        footer_html = self.config.footer_html_path.read_text(encoding="utf-8")
-        gr.HTML(footer_html)
+        gr.HTML(self._footer_html)
 
     @staticmethod
-    def handle_like(data: gr.LikeData, trace_ids: dict[int, str]) -> None:
+    async def handle_like(data: gr.LikeData, trace_ids: dict[int, str]) -> None:
         """Trace human feedback -> thumbs up or thumbs down"""
-        idx = data.index
-        assert isinstance(idx, int)
-        trace_id = trace_ids.get(idx, "")
-        
-        if trace_id:
-            if data.liked:
-                langfuse.create_score(value=1, name="user-feedback", trace_id=trace_id)
-            else:
-                langfuse.create_score(value=0, name="user-feedback", trace_id=trace_id)
-        else:
+        # Index is a list of [message, part] for multimodal messages
+        idx = data.index if isinstance(data.index, int) else (data.index[0] if data.index else -1)
+        trace_id = trace_ids.get(idx)
+        if not trace_id:
             print(f"Warning: No trace_id found for message at index {data.index}")
+            return
+
+        _run_in_background(
+            langfuse.create_score,
+            value=1 if data.liked else 0,
+            name="user-feedback",
+            trace_id=trace_id,
+        )
 
 if __name__ == "__main__":
     """Launch the portfolio chatbot."""
     agent = AgentRunner()
+    agent.warmup()
+    # Tracing is optional, so a Langfuse outage or bad keys must not block launch
+    try:
+        if not langfuse.auth_check():
+            print("Warning: Langfuse authentication failed; traces will not be recorded")
+    except Exception as exc:
+        print(f"Warning: Langfuse is unreachable ({exc}); traces will not be recorded")
     ui = ChatbotUI(agent)
     demo = ui.build_interface()
-    demo.launch()
\ No newline at end of file
+    demo.launch(ssr_mode=False, max_threads=ui.config.max_threads)
\ No newline at end of file
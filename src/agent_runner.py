@@ -1,16 +1,24 @@
 from __future__ import annotations
 
-from typing import AsyncGenerator, List, Dict
+import asyncio
+import threading
+from functools import cached_property
+from typing import Any, AsyncGenerator, List, Dict
 
 from src.agents.final_presentation import FinalPresentationAgent
 from src.agents.orchestrator import OrchestratorAgent
 from src.agents.professional_info import ProfessionalInfoAgent
 from src.agents.public_persona import PublicPersonaAgent
 from src.config import AppConfig
-from src.models.schemas import DownstreamAgent, AgentEventUnion, OrchestratorEvent, ProfessionalInfoEvent, PublicPersonaEvent, FinalPresentationEvent, AgentSource
-from src.tools.retrieval import create_retrieval_deps
+from src.models.schemas import DownstreamAgent, DownstreamRequest, AgentEventUnion, OrchestratorEvent, ProfessionalInfoEvent, PublicPersonaEvent, FinalPresentationEvent, AgentSource
+from src.tools.retrieval import RetrievalDeps, create_retrieval_deps
+from src.utils.instructions import preload_instructions
+from src.utils.openai_client import get_async_openai
 from src.vector_store.store import ProjectsVectorStore
 
+# Downstream agents that run before the final presentation
+_EVIDENCE_AGENTS = frozenset({DownstreamAgent.PROFESSIONAL_INFO, DownstreamAgent.PUBLIC_PERSONA})
+
 
 class AgentRunner:
     """Main agent orchestration system.
@@ -20,6 +28,7 @@ class AgentRunner:
     
     Attributes:
         config: Application configuration.
+        client: AsyncOpenAI client shared by all agents.
         orchestrator: Orchestrator agent for routing.
         professional_info: Professional info agent for evidence gathering.
         final_presentation: Final presentation agent for response generation.
@@ -34,16 +43,33 @@ class AgentRunner:
         """
         self.config = config or AppConfig()
 
+        # One HTTP/2 connection pool for every agent's OpenAI calls
+        self.client = get_async_openai()
+
         # Initialize agents
-        self.orchestrator = OrchestratorAgent(self.config.agent)
-        self.professional_info = ProfessionalInfoAgent(self.config.agent)
-        self.public_persona = PublicPersonaAgent(self.config.agent)
-        self.final_presentation = FinalPresentationAgent(self.config.agent)
+        self.orchestrator = OrchestratorAgent(self.config.agent, self.client)
+        self.professional_info = ProfessionalInfoAgent(self.config.agent, self.client)
+        self.public_persona = PublicPersonaAgent(self.config.agent, self.client)
+        self.final_presentation = FinalPresentationAgent(self.config.agent, self.client)
+
+        # Retrieval system is set up on first use
+        self._retrieval_lock = threading.Lock()
 
-        # Initialize retrieval system
-        self.retrieval_deps = self._setup_retrieval()
+    @cached_property
+    def retrieval_deps(self) -> RetrievalDeps:
+        """Retrieval dependencies, created on first access.
 
-    def _setup_retrieval(self):
+        Access from several threads at once sets them up only once.
+
+        Returns:
+            Configured retrieval dependencies.
+        """
+        with self._retrieval_lock:
+            if "retrieval_deps" in self.__dict__:
+                return self.__dict__["retrieval_deps"]
+            return self._setup_retrieval()
+
+    def _setup_retrieval(self) -> RetrievalDeps:
         """Set up the vector store and retrieval dependencies.
         
         Returns:
@@ -65,6 +91,27 @@ class AgentRunner:
         # Create retrieval dependencies
         return create_retrieval_deps(retriever, self.config.retrieval)
 
+    def warmup(self) -> None:
+        """Load lazily initialized models before the first query.
+
+        Fetches every agent's instructions into the prompt cache, then runs
+        one retrieval and one rerank so model weights, the embeddings
+        client, and the vector store connection are ready at startup.
+        """
+        agent_config = self.config.agent
+        for profile in (
+            agent_config.orchestrator,
+            agent_config.professional_info,
+            agent_config.public_persona,
+            agent_config.final_presentation,
+        ):
+            preload_instructions(profile.langfuse_key, profile.instructions_path)
+
+        retrieved = self.retrieval_deps.retriever.invoke("warmup")
+        self.retrieval_deps.reranker.predict(
+            [("warmup", doc.page_content) for doc in retrieved[:1]] or [("warmup", "warmup")]
+        )
+
     async def process_query(self, user_query: str, conversation: List[Dict[str, str]]) -> AsyncGenerator[AgentEventUnion, None]:
         """Process a user query through the agent pipeline.
         
@@ -75,32 +122,60 @@ class AgentRunner:
         Returns:
             Final response text.
         """
-        # Step 1: Route the query
-        orchestrator_output = await self.orchestrator.run(conversation)
-        yield OrchestratorEvent(from_=AgentSource.ORCHESTRATOR, output=orchestrator_output.model_dump_json(),)
-
-        # Step 2: Gather evidence if needed
+        # Step 1: Route the query, starting each downstream agent as soon as
+        # its request has streamed in
         evidence_bundle = None
         public_artifacts = None
-        for request in orchestrator_output.downstream_requests:
-            user_prompt = self._format_prompt(
-                    user_query, request
-                )
-            if request.agent == DownstreamAgent.PROFESSIONAL_INFO:
-                evidence_bundle = await self.professional_info.run(
-                    user_prompt, self.retrieval_deps
-                )
-                yield ProfessionalInfoEvent(from_=AgentSource.PROFESSIONAL_INFO, output=evidence_bundle.model_dump_json(),)
-            elif request.agent == DownstreamAgent.PUBLIC_PERSONA:
-                public_artifacts = await self.public_persona.run(
-                    user_prompt
-                )
-                yield PublicPersonaEvent(from_=AgentSource.PUBLIC_PERSONA, output=public_artifacts.model_dump_json())
+        tasks: list[asyncio.Task[tuple[DownstreamAgent, Any]]] = []
+        dispatched: set[tuple[DownstreamAgent, str, str]] = set()
+        try:
+            async for item in self.orchestrator.run(conversation):
+                if isinstance(item, DownstreamRequest):
+                    if item.agent not in _EVIDENCE_AGENTS:
+                        continue
+                    # Identical requests would only repeat the same agent run
+                    key = (item.agent, item.task, item.constraints or "")
+                    if key in dispatched:
+                        continue
+                    dispatched.add(key)
+                    tasks.append(asyncio.create_task(self._run_downstream(item, self._format_prompt(user_query, item))))
+                else:
+                    orchestrator_output = item
+            yield OrchestratorEvent(from_=AgentSource.ORCHESTRATOR, output=orchestrator_output.model_dump_json(),)
+
+            # Step 2: Gather evidence if needed, running downstream agents concurrently
+            for next_done in asyncio.as_completed(tasks):
+                agent, output = await next_done
+                if agent == DownstreamAgent.PROFESSIONAL_INFO:
+                    evidence_bundle = output
+                    yield ProfessionalInfoEvent(from_=AgentSource.PROFESSIONAL_INFO, output=evidence_bundle.model_dump_json(),)
+                elif agent == DownstreamAgent.PUBLIC_PERSONA:
+                    public_artifacts = output
+                    yield PublicPersonaEvent(from_=AgentSource.PUBLIC_PERSONA, output=public_artifacts.model_dump_json())
+        finally:
+            for task in tasks:
+                task.cancel()
 
         # Step 3: Stream final response
         async for partial_response in self.final_presentation.run(user_query, evidence_bundle, public_artifacts, orchestrator_output):
             yield FinalPresentationEvent(from_=AgentSource.FINAL_PRESENTATION, output=partial_response,)
 
+    async def _run_downstream(self, request, user_prompt: str) -> tuple[DownstreamAgent, Any]:
+        """Run the downstream agent a request is routed to.
+
+        Args:
+            request: The downstream request from orchestrator.
+            user_prompt: Formatted prompt for the downstream agent.
+
+        Returns:
+            Tuple of (agent the request was routed to, agent output).
+        """
+        if request.agent == DownstreamAgent.PROFESSIONAL_INFO:
+            # First access connects to the vector store, so keep it off the event loop
+            deps = await asyncio.to_thread(getattr, self, "retrieval_deps")
+            return request.agent, await self.professional_info.run(user_prompt, deps)
+        return request.agent, await self.public_persona.run(user_prompt)
+
     @staticmethod
     def _format_prompt(
         user_query: str, request
@@ -1,13 +1,29 @@
 """Final presentation agent for generating responses."""
 
 from __future__ import annotations
-from typing import AsyncGenerator
+import hashlib
+from collections import OrderedDict
+from typing import AsyncGenerator, Sequence
 
 from openai import AsyncOpenAI
+from pydantic import BaseModel
 from langfuse import observe, get_client
 
 from src.config import AgentConfig
 from src.models.schemas import DownstreamAgent, EvidenceBundle, OrchestratorRoute, PublicArtifacts
+from src.utils.instructions import get_instructions, prompt_cache_key
+
+
+def _json_array(models: Sequence[BaseModel]) -> str:
+    """Serialize models as one JSON array.
+
+    Args:
+        models: Pydantic models to serialize.
+
+    Returns:
+        JSON array text.
+    """
+    return "[" + ",".join(model.model_dump_json() for model in models) + "]"
 
 
 class FinalPresentationAgent:
@@ -20,19 +36,21 @@ class FinalPresentationAgent:
         config: Agent configuration.
         client: AsyncOpenAI client for API calls.
         langfuse_client: Langfuse client.
-        instructions: System instructions for the agent.
+        cache: LRU cache of responses keyed by a hash of the instructions and formatted input.
     """
 
-    def __init__(self, config: AgentConfig) -> None:
+    def __init__(self, config: AgentConfig, client: AsyncOpenAI) -> None:
         """Initialize the final presentation agent.
         
         Args:
             config: Agent configuration.
+            client: Shared AsyncOpenAI client.
         """
         self.config = config.final_presentation
-        self.client = AsyncOpenAI()
+        self.cache_config = config.response_cache
+        self.client = client
+        self.cache: OrderedDict[str, str] = OrderedDict()
         self.langfuse_client = get_client()
-        self.instructions = self._load_instructions()
 
     @observe(name="final_presentation_agent", capture_input=True, capture_output=True)
     async def run(
@@ -57,22 +75,43 @@ class FinalPresentationAgent:
         input_content = self._format_input(
             user_query, evidence_bundle, public_artifacts, orchestrator_output
         )
-        self.langfuse_client.update_current_span(metadata={"final_presentation_instructions": self.instructions, "user_prompt": input_content})
+        instructions = await self._load_instructions()
+        self.langfuse_client.update_current_span(metadata={"final_presentation_instructions_sha1": prompt_cache_key(instructions), "final_presentation_instructions_length": len(instructions), "user_prompt": input_content})
+
+        # Replay a cached response for an identical query and evidence as a single delta.
+        # The key is exact: near-identical evidence may still answer a different question.
+        cache_key = None
+        if self.cache_config.enabled:
+            digest = hashlib.sha256(prompt_cache_key(instructions).encode("ascii"))
+            digest.update(input_content.encode("utf-8"))
+            cache_key = digest.hexdigest()
+            if (cached := self.cache.get(cache_key)) is not None:
+                self.cache.move_to_end(cache_key)
+                yield cached
+                return
+
+        parts: list[str] = []
         async with self.client.responses.stream(
             model=self.config.model,
-            instructions=self.instructions,
+            instructions=instructions,
             input=[
                 {
                     "role": "user",
                     "content": input_content
                 }
             ],
-            reasoning={"effort": "medium"}
+            reasoning={"effort": "medium"},
+            prompt_cache_key=prompt_cache_key(instructions),
         ) as stream:
             async for event in stream:
                 if event.type == "response.output_text.delta":
+                    parts.append(event.delta)
                     yield event.delta
                 if event.type == "response.completed":
+                    if cache_key is not None:
+                        self.cache[cache_key] = "".join(parts)
+                        while len(self.cache) > self.cache_config.max_size:
+                            self.cache.popitem(last=False)
                     break
 
     def _format_input(
@@ -93,47 +132,34 @@ class FinalPresentationAgent:
         Returns:
             Formatted input string.
         """
-        user_input = f"Original user query: {user_query}\n"
+        lines = [f"Original user query: {user_query}"]
         if evidence_bundle:
-            coverage = evidence_bundle.coverage_assessment.model_dump_json()
-            claims = [claim.model_dump_json() for claim in evidence_bundle.claims]
-            projects = ", ".join(evidence_bundle.project_leads or [])
-            redirect = evidence_bundle.safe_redirect_if_missing or "none"
-            user_input += (
-                "Evidence Mode A:\n"
-                f"Coverage assessment: {coverage}\n"
-                f"Claims: {claims}\n"
-                f"Relevant projects: {projects}\n"
-                f"Safe redirect: {redirect}\n"
+            lines += (
+                "Evidence Mode A:",
+                f"Coverage assessment: {evidence_bundle.coverage_assessment.model_dump_json()}",
+                f"Claims: {_json_array(evidence_bundle.claims)}",
+                f"Relevant projects: {', '.join(evidence_bundle.project_leads or [])}",
+                f"Safe redirect: {evidence_bundle.safe_redirect_if_missing or 'none'}",
             )
         if public_artifacts:
-            coverage = public_artifacts.coverage_assessment.model_dump_json()
-            artifacts = [artifact.model_dump_json() for artifact in public_artifacts.artifacts]
-            account_metadata = [metadata.model_dump_json() for metadata in public_artifacts.account_metadata or []]
-            redirect = public_artifacts.safe_redirect_if_missing or "none"
-            user_input += (
-                "Evidence Mode B:\n"
-                f"Coverage assessment: {coverage}\n"
-                f"Artifacts: {artifacts}\n"
-                f"Account metadata: {account_metadata}\n"
-                f"Safe redirect: {redirect}\n"
+            lines += (
+                "Evidence Mode B:",
+                f"Coverage assessment: {public_artifacts.coverage_assessment.model_dump_json()}",
+                f"Artifacts: {_json_array(public_artifacts.artifacts)}",
+                f"Account metadata: {_json_array(public_artifacts.account_metadata or [])}",
+                f"Safe redirect: {public_artifacts.safe_redirect_if_missing or 'none'}",
             )
-            
-        
         if orchestrator_output.refusal_directive.needed:
-            user_input += f"Refusal directive: {orchestrator_output.refusal_directive.model_dump_json()}\n"
+            lines.append(f"Refusal directive: {orchestrator_output.refusal_directive.model_dump_json()}")
         if orchestrator_output.downstream_requests and orchestrator_output.downstream_requests[-1].agent == DownstreamAgent.FINAL_PRESENTATION:
-            user_input += f"Task directive: {orchestrator_output.downstream_requests[-1].task}"
-            
-        return user_input
+            lines.append(f"Task directive: {orchestrator_output.downstream_requests[-1].task}")
+
+        return "\n".join(lines)
 
-    def _load_instructions(self) -> str:
-        """Load system instructions from file.
+    async def _load_instructions(self) -> str:
+        """Load system instructions from the shared prompt cache.
         
         Returns:
             System instructions text.
         """
-        try:
-            return self.langfuse_client.get_prompt(self.config.langfuse_key).prompt
-        except:
-            return self.config.instructions_path.read_text(encoding="utf-8")
\ No newline at end of file
+        return await get_instructions(self.config.langfuse_key, self.config.instructions_path)
\ No newline at end of file
@@ -2,13 +2,94 @@
 
 from __future__ import annotations
 
-from typing import List, Dict, cast
+import asyncio
+import re
+from typing import AsyncGenerator, List, Dict, cast
 from openai import AsyncOpenAI
+from pydantic import ValidationError
 from openai.types.responses import ResponseInputParam
 from langfuse import observe, get_client
 
 from src.config import AgentConfig
-from src.models.schemas import OrchestratorRoute
+from src.models.schemas import DownstreamRequest, OrchestratorRoute
+from src.utils.instructions import get_instructions, prompt_cache_key
+from src.utils.orchestrator_cache import OrchestratorCache
+
+# Confidence is the first field of the route, so it streams in before any request
+_CONFIDENCE_RE = re.compile(r'\s*\{\s*"confidence"\s*:\s*(-?[0-9.]+(?:[eE][-+]?[0-9]+)?)\s*[,}]')
+
+
+class _DownstreamRequestScanner:
+    """Incrementally extracts downstream requests from streamed route JSON.
+
+    Tracks string and nesting state across deltas so each object in the
+    top-level ``downstream_requests`` array can be parsed as soon as its
+    closing brace arrives. The leading ``confidence`` value is read as
+    soon as it is complete.
+
+    Attributes:
+        confidence: The route's confidence, or None until it has streamed in.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty scanner."""
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_key = ""
+        self._in_requests = False
+        self._item_start: int | None = None
+        self.confidence: float | None = None
+
+    def feed(self, delta: str) -> list[DownstreamRequest]:
+        """Consume a chunk of output text.
+
+        Args:
+            delta: Next chunk of the streamed JSON.
+
+        Returns:
+            Downstream requests completed by this chunk.
+        """
+        self._text += delta
+        text = self._text
+        if self.confidence is None and (match := _CONFIDENCE_RE.match(text)):
+            self.confidence = float(match.group(1))
+        completed: list[DownstreamRequest] = []
+        for i in range(self._pos, len(text)):
+            char = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_key = text[self._string_start + 1 : i]
+            elif char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char in "{[":
+                self._depth += 1
+                if char == "[" and self._depth == 2 and self._last_key == "downstream_requests":
+                    self._in_requests = True
+                elif char == "{" and self._in_requests and self._depth == 3:
+                    self._item_start = i
+            elif char in "}]":
+                if char == "}" and self._item_start is not None and self._depth == 3:
+                    try:
+                        completed.append(DownstreamRequest.model_validate_json(text[self._item_start : i + 1]))
+                    except ValidationError:
+                        pass
+                    self._item_start = None
+                elif char == "]" and self._in_requests and self._depth == 2:
+                    self._in_requests = False
+                self._depth -= 1
+        self._pos = len(text)
+        return completed
 
 
 class OrchestratorAgent:
@@ -21,54 +102,177 @@ class OrchestratorAgent:
         config: Agent configuration.
         client: AsyncOpenAI client for API calls.
         langfuse_client: Langfuse client.
-        instructions: System instructions for the agent.
+        route_cache: Exact-match cache of routes per conversation.
     """
 
-    def __init__(self, config: AgentConfig) -> None:
+    def __init__(self, config: AgentConfig, client: AsyncOpenAI) -> None:
         """Initialize the orchestrator agent.
         
         Args:
             config: Agent configuration.
+            client: Shared AsyncOpenAI client.
         """
         self.config = config.orchestrator
-        self.client = AsyncOpenAI()
+        self.client = client
+        self.route_cache = OrchestratorCache(config.orchestrator_cache_size)
+        self._semaphore = asyncio.Semaphore(config.orchestrator_max_inflight)
+        self._inflight: dict[str, asyncio.Future[OrchestratorRoute]] = {}
         self.langfuse_client = get_client()
-        self.instructions = self._load_instructions()
 
     @observe(name="orchestrator_agent", capture_input=True, capture_output=True)
-    async def run(self, conversation: List[Dict[str, str]]) -> OrchestratorRoute:
-        """Process a user message and determine routing.
-        
+    async def run(self, conversation: List[Dict[str, str]]) -> AsyncGenerator[DownstreamRequest | OrchestratorRoute, None]:
+        """Process a user message and stream the routing decision.
+
+        Each downstream request is yielded as soon as its JSON object is
+        complete in the streamed output, so callers can start downstream
+        agents before the orchestrator finishes. The full parsed route is
+        yielded last.
+
         Args:
             conversation: List of user queries and generated responses over the past.
-            
-        Returns:
-            Routing decision with downstream requests.
-            
+
+        Yields:
+            Downstream requests in output order, followed by the routing decision.
+
         Raises:
             Exception: If the agent fails to parse the response.
         """
-        self.langfuse_client.update_current_span(metadata={"orchestrator_instructions": self.instructions})
-        response = await self.client.responses.parse(
+        instructions = await self._load_instructions()
+        self.langfuse_client.update_current_span(metadata={"orchestrator_instructions_sha1": prompt_cache_key(instructions), "orchestrator_instructions_length": len(instructions)})
+
+        # The same conversation text under the same instructions routes the same way
+        route_key = self.route_cache.make_key(conversation, prompt_cache_key(instructions))
+        if (route := self.route_cache.get(route_key)) is not None:
+            for request in route.downstream_requests:
+                yield request
+            yield route
+            return
+
+        # Identical conversations already being routed share that call's result
+        pending = self._inflight.get(route_key)
+        if pending is not None and (route := await self._await_leader(pending)) is not None:
+            for request in route.downstream_requests:
+                yield request
+            yield route
+            return
+
+        leader: asyncio.Future[OrchestratorRoute] = asyncio.get_running_loop().create_future()
+        self._inflight[route_key] = leader
+        try:
+            # Route cheaply first and escalate only when the model is unsure
+            route = None
+            async with self._semaphore:
+                async for item in self._stream_route(instructions, conversation, self.config.effort, self.config.min_confidence):
+                    if item is None:
+                        break
+                    if isinstance(item, DownstreamRequest):
+                        yield item
+                    else:
+                        route = item
+                if route is None:
+                    async for item in self._stream_route(instructions, conversation, self.config.escalation_effort, float("-inf")):
+                        if isinstance(item, DownstreamRequest):
+                            yield item
+                        elif item is not None:
+                            route = item
+            self.route_cache.put(route_key, route)
+            leader.set_result(route)
+            yield route
+        finally:
+            if self._inflight.get(route_key) is leader:
+                del self._inflight[route_key]
+            # Followers of a failed call fall back to routing on their own
+            if not leader.done():
+                leader.cancel()
+
+    async def _stream_route(
+        self,
+        instructions: str,
+        conversation: List[Dict[str, str]],
+        effort: str,
+        min_confidence: float,
+    ) -> AsyncGenerator[DownstreamRequest | OrchestratorRoute | None, None]:
+        """Stream one routing call at a given reasoning effort.
+
+        Args:
+            instructions: System instructions for the agent.
+            conversation: List of user queries and generated responses over the past.
+            effort: Reasoning effort for the call.
+            min_confidence: Confidence below which the call is abandoned.
+
+        Yields:
+            Downstream requests followed by the route, or a single None if the
+            reported confidence is below ``min_confidence``.
+
+        Raises:
+            Exception: If the agent fails to parse the response.
+        """
+        scanner = _DownstreamRequestScanner()
+        # Requests completed before the confidence is known are held back
+        held: list[DownstreamRequest] = []
+        abandoned = False
+        async with self.client.responses.stream(
             model=self.config.model,
-            instructions=self.instructions,
+            instructions=instructions,
             input=cast(ResponseInputParam, conversation),
+            # The SDK builds the strict schema from the model on each call;
+            # text_format is its only public route to output_parsed
             text_format=OrchestratorRoute,
-            reasoning={"effort": "high"}
-        )
+            reasoning={"effort": effort},
+            prompt_cache_key=prompt_cache_key(instructions),
+        ) as stream:
+            async for event in stream:
+                if event.type == "response.output_text.delta":
+                    held += scanner.feed(event.delta)
+                    if scanner.confidence is None:
+                        continue
+                    if scanner.confidence < min_confidence:
+                        abandoned = True
+                        break
+                    for request in held:
+                        yield request
+                    held.clear()
+            if not abandoned:
+                response = await stream.get_final_response()
+
+        # Leaving the stream context above closes the connection, so an
+        # abandoned call stops generating before the caller escalates
+        if abandoned:
+            yield None
+            return
+
+        route = response.output_parsed
+        if route is None:
+            raise Exception(f"OrchestratorAgent failed to parse response: {response}")
+        if route.confidence < min_confidence:
+            yield None
+            return
+        for request in held:
+            yield request
+        yield route
+
+    @staticmethod
+    async def _await_leader(pending: asyncio.Future[OrchestratorRoute]) -> OrchestratorRoute | None:
+        """Wait for an identical in-flight routing call to finish.
 
-        if response.output_parsed:
-            return response.output_parsed
+        Args:
+            pending: Future resolved with the in-flight call's route.
 
-        raise Exception(f"OrchestratorAgent failed to parse response: {response}")
+        Returns:
+            The shared route, or None if the in-flight call failed.
+        """
+        try:
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            task = asyncio.current_task()
+            if task is not None and task.cancelling():
+                raise
+            return None
 
-    def _load_instructions(self) -> str:
-        """Load system instructions from langfuse or file.
+    async def _load_instructions(self) -> str:
+        """Load system instructions from the shared prompt cache.
         
         Returns:
             System instructions text.
         """
-        try:
-            return self.langfuse_client.get_prompt(self.config.langfuse_key).prompt
-        except:
-            return self.config.instructions_path.read_text(encoding="utf-8")
\ No newline at end of file
+        return await get_instructions(self.config.langfuse_key, self.config.instructions_path)
\ No newline at end of file
@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+from typing import Literal
+
+from openai import AsyncOpenAI
 from pydantic_ai import Agent, RunContext, ModelSettings
+from pydantic_ai.models.openai import OpenAIChatModel
+from pydantic_ai.providers.openai import OpenAIProvider
 from langfuse import observe, get_client
-from pymupdf import open as pdfopen
+from pymupdf import TOOLS, open as pdfopen
 
 from src.config import AgentConfig
 from src.models.schemas import EvidenceBundle
 from src.tools.retrieval import RetrievalDeps, retrieve_and_rerank
-from src.tools.github_repos import fetch_project_repos
+from src.tools.github_repos import fetch_project_repos_cached
+from src.utils.instructions import get_instructions, prompt_cache_key
+from src.utils.tracing import trace_output
+
+
+DocumentName = Literal["resume", "old_resume", "transcript_of_records", "about_sanath"]
 
 
 class ProfessionalInfoAgent:
@@ -20,20 +31,29 @@ class ProfessionalInfoAgent:
     
     Attributes:
         config: Agent configuration.
+        client: Shared AsyncOpenAI client.
         langfuse_client: Langfuse client.
-        instructions: System instructions for the agent.
         agent: PydanticAI agent instance.
     """
 
-    def __init__(self, config: AgentConfig) -> None:
+    def __init__(self, config: AgentConfig, client: AsyncOpenAI) -> None:
         """Initialize the professional info agent.
         
         Args:
             config: Agent configuration.
+            client: Shared AsyncOpenAI client.
         """
         self.config = config.professional_info
         self.langfuse_client = get_client()
-        self.instructions = self._load_instructions()
+        self.client = client
+        # Static documents do not change at runtime, so read them once
+        tool_config = self.config.tool_config
+        self._resume_text = tool_config.resume_path.read_text(encoding="utf-8")
+        self._about_text = tool_config.about_me_path.read_text(encoding="utf-8")
+        self._old_resume_text = self._read_pdf(tool_config.old_resume_path)
+        self._transcript_text = self._read_pdf(tool_config.transcript_of_records_path)
+        # The PDFs are never reopened, so release MuPDF's font and glyph caches
+        TOOLS.store_shrink(100)
         self.agent: Agent[RetrievalDeps, EvidenceBundle] = self._create_agent()
         self._register_tools()
 
@@ -50,10 +70,12 @@ class ProfessionalInfoAgent:
         Returns:
             Evidence bundle with claims and coverage assessment.
         """
-        self.langfuse_client.update_current_span(metadata={"professional_info_instructions": self.instructions, "user_prompt": user_prompt})
+        instructions = await self._load_instructions()
+        self.langfuse_client.update_current_span(metadata={"professional_info_instructions_sha1": prompt_cache_key(instructions), "professional_info_instructions_length": len(instructions), "user_prompt": user_prompt})
         result = await self.agent.run(
-            instructions=self.instructions,
+            instructions=instructions,
             user_prompt=user_prompt,
+            model_settings=ModelSettings(extra_body={"prompt_cache_key": prompt_cache_key(instructions)}),
             deps=deps,
         )
         return result.output
@@ -65,18 +87,31 @@ class ProfessionalInfoAgent:
             Configured Agent instance.
         """
         return Agent(
-            self.config.model,
+            OpenAIChatModel(self.config.model, provider=OpenAIProvider(openai_client=self.client)),
             deps_type=RetrievalDeps,
             output_type=EvidenceBundle,
             model_settings=ModelSettings(temperature=0, parallel_tool_calls=True)
         )
 
+    @staticmethod
+    def _read_pdf(path: Path) -> str:
+        """Extract the plain text of a PDF.
+
+        Args:
+            path: Path to the PDF file.
+
+        Returns:
+            Text of all pages joined by newlines.
+        """
+        with pdfopen(path) as doc:
+            return "\n".join([page.get_text("text", sort=False) for page in doc])
+
     def _register_tools(self) -> None:
         """Register tools with the agent."""
 
         @self.agent.tool_plain
-        @observe(name="resume", capture_input=True, capture_output=True)
-        def read_resume() -> str:
+        @observe(name="resume", capture_input=False, capture_output=False)
+        async def read_resume() -> str:
             """Return the full text of Sanath’s resume.
 
             Use this tool when you need:
@@ -91,11 +126,11 @@ class ProfessionalInfoAgent:
             Returns:
                 resume: Full text of Sanath’s resume.
             """
-            return self.config.tool_config.resume_path.read_text(encoding="utf-8")
+            return self._resume_text
         
         @self.agent.tool_plain
-        @observe(name="resume_old", capture_input=True, capture_output=True)
-        def read_old_resume() -> str:
+        @observe(name="resume_old", capture_input=False, capture_output=False)
+        async def read_old_resume() -> str:
             """Return the full text of Sanath's old resume.
 
             Use this tool when you need:
@@ -104,13 +139,11 @@ class ProfessionalInfoAgent:
             Returns:
                 old_resume: Full text of Sanath's old resume.
             """
-            with pdfopen(self.config.tool_config.old_resume_path) as doc:
-                old_resume = "\n".join(str(page.get_text("text")) for page in doc)
-            return old_resume
+            return self._old_resume_text
         
         @self.agent.tool_plain
-        @observe(name="transcript_of_records", capture_input=True, capture_output=True)
-        def read_transcript_of_records() -> str:
+        @observe(name="transcript_of_records", capture_input=False, capture_output=False)
+        async def read_transcript_of_records() -> str:
             """Return the full text of Sanath's master's degree transcript of records.
 
             Use this tool when you need:
@@ -119,13 +152,11 @@ class ProfessionalInfoAgent:
             Returns:
                 transcript_of_records: Full text of Sanath's transcript of records.
             """
-            with pdfopen(self.config.tool_config.transcript_of_records_path) as doc:
-                transcript_of_records = "\n".join(str(page.get_text("text")) for page in doc)
-            return transcript_of_records
+            return self._transcript_text
 
         @self.agent.tool_plain
-        @observe(name="about_sanath", capture_input=True, capture_output=True)
-        def read_about_sanath() -> str:
+        @observe(name="about_sanath", capture_input=False, capture_output=False)
+        async def read_about_sanath() -> str:
             """Return the narrative 'About Sanath' profile text.
 
             Use this tool when you need:
@@ -141,20 +172,46 @@ class ProfessionalInfoAgent:
             Returns:
                 about_me: Narrative profile text about Sanath.
             """
-            return self.config.tool_config.about_me_path.read_text(encoding="utf-8")
+            return self._about_text
+
+        @self.agent.tool_plain
+        @observe(name="documents", capture_input=True, capture_output=False)
+        async def read_documents(names: list[DocumentName]) -> dict[str, str]:
+            """Return the full text of several of Sanath's documents in one call.
+
+            Use this tool instead of calling the single document tools one
+            after another when the task needs more than one document, e.g.
+            the resume together with the About Sanath profile.
+
+            Args:
+                names: Documents to read. Any of "resume", "old_resume",
+                    "transcript_of_records" and "about_sanath".
+
+            Returns:
+                documents: Mapping of each requested name to its full text.
+            """
+            documents = {
+                "resume": self._resume_text,
+                "old_resume": self._old_resume_text,
+                "transcript_of_records": self._transcript_text,
+                "about_sanath": self._about_text,
+            }
+            return {name: documents[name] for name in dict.fromkeys(names)}
 
-        
         @self.agent.tool_plain
-        @observe(name="github_repos", capture_input=True, capture_output=True)
+        @observe(name="github_repos", capture_input=True, capture_output=False)
         async def fetch_github_repos() -> str:
             """Fetch Sanath's GitHub repositories for project linking.
     
             This tool returns a JSON list of repository metadata including name, description, and GitHub URL.
             """
-            return await fetch_project_repos(self.config.tool_config.github_repos_endpoint)
+            tool_config = self.config.tool_config
+            repos = await fetch_project_repos_cached(tool_config.github_repos_endpoint, tool_config.github_repos_ttl)
+            self.langfuse_client.update_current_span(output=trace_output(repos))
+            return repos
 
         @self.agent.tool
-        @observe(name="retrieve", capture_input=True, capture_output=True)
+        @observe(name="retrieve", capture_input=True, capture_output=False)
         async def retrieve(
             context: RunContext[RetrievalDeps], search_query: str
         ) -> list[str]:
@@ -194,15 +251,14 @@ class ProfessionalInfoAgent:
             Returns:
                 ranked_docs: List of relevant text chunks from Sanath’s portfolio documents.
             """
-            return await retrieve_and_rerank(context.deps, search_query)
+            ranked_docs = await retrieve_and_rerank(context.deps, search_query)
+            self.langfuse_client.update_current_span(output=trace_output("\n\n".join(ranked_docs)))
+            return ranked_docs
 
-    def _load_instructions(self) -> str:
-        """Load system instructions from langfuse or file.
+    async def _load_instructions(self) -> str:
+        """Load system instructions from the shared prompt cache.
         
         Returns:
             System instructions text.
         """
-        try:
-            return self.langfuse_client.get_prompt(self.config.langfuse_key).prompt
-        except:
-            return self.config.instructions_path.read_text(encoding="utf-8")
\ No newline at end of file
+        return await get_instructions(self.config.langfuse_key, self.config.instructions_path)
\ No newline at end of file
@@ -2,23 +2,46 @@
 
 from __future__ import annotations
 
+import asyncio
+from json import dumps, loads
+
+from openai import AsyncOpenAI
 from pydantic_ai import Agent, ModelSettings
+from pydantic_ai.models.openai import OpenAIChatModel
+from pydantic_ai.providers.openai import OpenAIProvider
 from langfuse import observe, get_client
 
 from src.config import AgentConfig
 from src.models.schemas import PublicArtifacts
 from src.tools.social_media_retrieval import get_instagram_posts, get_youtube_videos
+from src.utils.instructions import get_instructions, prompt_cache_key
+from src.utils.tracing import trace_output
+
+
+def _feed_content(result: str | BaseException) -> object:
+    """Decode one feed of a concurrent fetch.
+
+    Args:
+        result: The tool's JSON output, or the exception it raised.
+
+    Returns:
+        The decoded feed, or an error entry if the fetch failed.
+    """
+    if isinstance(result, BaseException):
+        return {"error": f"Could not retrieve any content: {result}"}
+    return loads(result)
 
 class PublicPersonaAgent:
-    def __init__(self, config: AgentConfig) -> None:
+    def __init__(self, config: AgentConfig, client: AsyncOpenAI) -> None:
         """Initialize the public persona agent.
         
         Args:
             config: Agent configuration.
+            client: Shared AsyncOpenAI client.
         """
         self.config = config.public_persona
         self.langfuse_client = get_client()
-        self.instructions = self._load_instructions()
+        self.client = client
         self.agent: Agent[None, PublicArtifacts] = self._create_agent()
         self._register_tools()
         
@@ -29,7 +52,7 @@ class PublicPersonaAgent:
             Configured Agent instance.
         """
         return Agent(
-            self.config.model,
+            OpenAIChatModel(self.config.model, provider=OpenAIProvider(openai_client=self.client)),
             output_type=PublicArtifacts,
             model_settings=ModelSettings(temperature=0, parallel_tool_calls=True)
         )
@@ -44,10 +67,12 @@ class PublicPersonaAgent:
         Returns:
             Public artifacts with account metadata and retrieved artifacts.
         """
-        self.langfuse_client.update_current_span(metadata={"public_persona_instructions": self.instructions, "user_prompt": user_prompt})
+        instructions = await self._load_instructions()
+        self.langfuse_client.update_current_span(metadata={"public_persona_instructions_sha1": prompt_cache_key(instructions), "public_persona_instructions_length": len(instructions), "user_prompt": user_prompt})
         result = await self.agent.run(
-            instructions=self.instructions,
+            instructions=instructions,
             user_prompt=user_prompt,
+            model_settings=ModelSettings(extra_body={"prompt_cache_key": prompt_cache_key(instructions)}),
         )
         return result.output
         
@@ -55,7 +80,7 @@ class PublicPersonaAgent:
         """Register tools with the agent."""
         
         @self.agent.tool_plain
-        @observe(name="instagram", capture_input=True, capture_output=True)
+        @observe(name="instagram", capture_input=True, capture_output=False)
         async def get_instagram_content() -> str:
             """Fetch public Instagram content for Sanath.
 
@@ -82,10 +107,12 @@ class PublicPersonaAgent:
             media_endpoint = self.config.tool_config.instagram_media_endpoint
             account_info_fields = self.config.tool_config.instagram_account_info_fields
             media_fields = self.config.tool_config.instagram_media_fields
-            return await get_instagram_posts(account_info_endpoint, media_endpoint, account_info_fields, media_fields)
+            posts = await get_instagram_posts(account_info_endpoint, media_endpoint, account_info_fields, media_fields)
+            self.langfuse_client.update_current_span(output=trace_output(posts))
+            return posts
         
         @self.agent.tool_plain
-        @observe(name="youtube", capture_input=True, capture_output=True)
+        @observe(name="youtube", capture_input=True, capture_output=False)
         async def get_youtube_content():
             """Fetch all uploaded YouTube videos and channel metadata for Sanath.
 
@@ -116,15 +143,45 @@ class PublicPersonaAgent:
                 google.auth.exceptions.GoogleAuthError: On authentication failure.
                 HttpError: If an API call to YouTube fails.
             """
-            return await get_youtube_videos()
+            videos = await get_youtube_videos()
+            self.langfuse_client.update_current_span(output=trace_output(videos))
+            return videos
+
+        @self.agent.tool_plain
+        @observe(name="public_content", capture_input=True, capture_output=False)
+        async def get_public_content() -> str:
+            """Fetch Sanath's public Instagram and YouTube content in one call.
+
+            Use this tool when no platform is specified, instead of calling
+            the Instagram and YouTube tools separately. Both feeds are
+            fetched concurrently.
+
+            Returns:
+                str: A JSON-serialized object with:
+                    - instagram: The get_instagram_content result.
+                    - youtube: The get_youtube_content result.
+                A feed that fails to load is replaced by an object with
+                an "error" message.
+            """
+            tool_config = self.config.tool_config
+            posts, videos = await asyncio.gather(
+                get_instagram_posts(
+                    tool_config.instagram_account_info_endpoint,
+                    tool_config.instagram_media_endpoint,
+                    tool_config.instagram_account_info_fields,
+                    tool_config.instagram_media_fields,
+                ),
+                get_youtube_videos(),
+                return_exceptions=True,
+            )
+            content = dumps({"instagram": _feed_content(posts), "youtube": _feed_content(videos)})
+            self.langfuse_client.update_current_span(output=trace_output(content))
+            return content
         
-    def _load_instructions(self) -> str:
-        """Load system instructions from langfuse or file.
+    async def _load_instructions(self) -> str:
+        """Load system instructions from the shared prompt cache.
         
         Returns:
             System instructions text.
         """
-        try:
-            return self.langfuse_client.get_prompt(self.config.langfuse_key).prompt
-        except:
-            return self.config.instructions_path.read_text(encoding="utf-8")
\ No newline at end of file
+        return await get_instructions(self.config.langfuse_key, self.config.instructions_path)
\ No newline at end of file
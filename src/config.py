@@ -20,11 +20,30 @@ class VectorStoreConfig:
         port: Qdrant service port.
         collection_name: Name of the collection to use.
         embedding_model: OpenAI embedding model identifier.
+        embedding_batch_size: Maximum number of texts per embedding request.
+        embedding_batch_max_tokens: Token budget per embedding request.
+        embedding_max_input_tokens: Token limit of a single embedding input.
+            Longer texts are embedded in windows of this size and averaged.
+        embedding_concurrency: Maximum embedding requests in flight at once.
+        upload_batch_size: Number of points per Qdrant upload request.
+        upload_parallel: Number of parallel Qdrant upload workers. Values above
+            1 spawn worker processes that re-import the entry point, so raise
+            it only for large corpora.
+        query_batch_size: Maximum number of search queries embedded in one request.
+        query_batch_window: Seconds to collect concurrent search queries into one request.
     """
     url: str = getenv("QDRANT_URL", "")
     port: int = int(getenv("QDRANT_PORT", ""))
     collection_name: str = "sanath_projects"
     embedding_model: str = "text-embedding-3-small"
+    embedding_batch_size: int = 512
+    embedding_batch_max_tokens: int = 300_000
+    embedding_max_input_tokens: int = 8191
+    embedding_concurrency: int = 8
+    upload_batch_size: int = 256
+    upload_parallel: int = 1
+    query_batch_size: int = 64
+    query_batch_window: float = 0.005
 
 
 @dataclass(frozen=True)
@@ -35,10 +54,18 @@ class ProcessorConfig:
         input_glob: Glob pattern for input files.
         config_path: Path to JSON metadata configuration.
         num_threads: Number of threads for PDF processing.
+        cache_dir: Directory for cached PDF-to-Markdown conversions.
+        queue_size: Capacity of the queues between document build stages.
+        ocr_probe_pages: Number of leading PDF pages probed for a text layer.
+        ocr_min_chars: Minimum probed characters to convert a PDF without OCR.
     """
     input_glob: str = "./data/*"
     config_path: Path = Path("./configs/data_config.json")
     num_threads: int = 4
+    cache_dir: Path = Path("./.cache/docling")
+    queue_size: int = 4
+    ocr_probe_pages: int = 3
+    ocr_min_chars: int = 200
 
 @dataclass(frozen=True)
 class AgentProfile:
@@ -46,6 +73,12 @@ class AgentProfile:
     instructions_path: Path
     langfuse_key: str
     
+@dataclass(frozen=True)
+class OrchestratorProfile(AgentProfile):
+    effort: str = "low"
+    escalation_effort: str = "high"
+    min_confidence: float = 0.7
+
 @dataclass(frozen=True)
 class ProfessionalInfoProfile(AgentProfile):
     tool_config: ProfessionalInfoToolConfig
@@ -61,19 +94,32 @@ class ProfessionalInfoToolConfig:
     old_resume_path: Path = Path("./prompts/Sanath Vijay Haritsa - Old CV.pdf")
     transcript_of_records_path: Path = Path("./prompts/Sanath Vijay Haritsa - Transcript of Records.pdf")
     github_repos_endpoint: str = "https://api.github.com/users/sanath95/repos"
+    github_repos_ttl: float = 600.0
     
 @dataclass(frozen=True)
 class PublicPersonaToolConfig:
-    instagram_account_info_endpoint = "https://graph.instagram.com/me"
-    instagram_media_endpoint = "https://graph.instagram.com/me/media"
-    instagram_account_info_fields = "username,media_count"
-    instagram_media_fields = "id,caption,like_count,comments_count,media_type,timestamp,permalink"
+    instagram_account_info_endpoint: str = "https://graph.instagram.com/me"
+    instagram_media_endpoint: str = "https://graph.instagram.com/me/media"
+    instagram_account_info_fields: str = "username,media_count"
+    instagram_media_fields: str = "id,caption,like_count,comments_count,media_type,timestamp,permalink"
+
+@dataclass(frozen=True)
+class ResponseCacheConfig:
+    """Configuration for the final response cache.
+
+    Attributes:
+        enabled: Whether the final presentation agent reuses responses for
+            an identical query and evidence.
+        max_size: Maximum number of cached responses.
+    """
+    enabled: bool = True
+    max_size: int = 256
 
 @dataclass(frozen=True)
 class AgentConfig:
     """Configuration for AI agents."""
 
-    orchestrator: AgentProfile = AgentProfile(
+    orchestrator: OrchestratorProfile = OrchestratorProfile(
         model="o3-mini",
         instructions_path=Path("./prompts/orchestrator.txt"),
         langfuse_key="instructions/orchestrator"
@@ -99,6 +145,10 @@ class AgentConfig:
         langfuse_key="instructions/final_presentation",
     )
 
+    response_cache: ResponseCacheConfig = ResponseCacheConfig()
+    orchestrator_cache_size: int = 256
+    orchestrator_max_inflight: int = 16
+
 @dataclass(frozen=True)
 class RetrievalConfig:
     """Configuration for retrieval and reranking.
@@ -108,11 +158,15 @@ class RetrievalConfig:
         retrieval_k: Number of documents to retrieve.
         reranker_model: Model for reranking.
         reranker_threshold: Minimum score threshold for reranked documents.
+        query_cache_size: Maximum number of search queries with cached results.
+        query_cache_ttl: Seconds cached search results stay valid.
     """
     search_type = "similarity"
     retrieval_k: int = 10
     reranker_model: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
     reranker_threshold: float = 0.0
+    query_cache_size: int = 512
+    query_cache_ttl: float = 300.0
 
 @dataclass(frozen=True)
 class AppConfig:
@@ -138,7 +192,21 @@ class GradioConfig:
         header_html_path: Path for the chatbot header html.
         footer_html_path: Path for the chatbot footer html.
         image_path: Path for Sanath's photo.
+        stream_flush_interval: Seconds after which buffered output is streamed to the UI.
+        stream_flush_chars: Buffered characters after which output is streamed to the UI.
+        concurrency_limit: Number of events the queue processes at once.
+        max_queue_size: Number of events that may wait in the queue.
+        max_threads: Size of the thread pool running synchronous handlers.
+        session_ttl: Seconds of inactivity after which a session's conversation is dropped.
+        max_history: Maximum number of messages kept in a session's conversation.
     """
     header_html_path: Path = Path("./static/header.html")
     footer_html_path: Path = Path("./static/footer.html")
-    image_path: Path = Path("./static/sanath_vijay_haritsa.png")
\ No newline at end of file
+    image_path: Path = Path("./static/sanath_vijay_haritsa.png")
+    stream_flush_interval: float = 0.05
+    stream_flush_chars: int = 64
+    concurrency_limit: int = 16
+    max_queue_size: int = 64
+    max_threads: int = 40
+    session_ttl: float = 1800.0
+    max_history: int = 40
\ No newline at end of file
@@ -71,10 +71,12 @@ class OrchestratorRoute(BaseModel):
     """Orchestrator routing decision.
     
     Attributes:
+        confidence: Confidence in the routing decision, from 0 to 1.
         reinterpretation: Query reinterpretation result.
         downstream_requests: List of requests to downstream agents.
         refusal_directive: Refusal directive if applicable.
     """
+    confidence: float = Field(..., description="Confidence in the routing decision, from 0 to 1")
     reinterpretation: Reinterpretation
     downstream_requests: list[DownstreamRequest]
     refusal_directive: RefusalDirective
@@ -1,5 +1,5 @@
 """Tools and utilities for RAG operations."""
 
-from src.tools.retrieval import RetrievalDeps, create_retrieval_deps, retrieve_and_rerank
+from src.tools.retrieval import QueryCache, RetrievalDeps, create_retrieval_deps, retrieve_and_rerank
 
-__all__ = ["RetrievalDeps", "retrieve_and_rerank", "create_retrieval_deps"]
\ No newline at end of file
+__all__ = ["QueryCache", "RetrievalDeps", "retrieve_and_rerank", "create_retrieval_deps"]
\ No newline at end of file
@@ -1,7 +1,95 @@
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
 from os import getenv
-from aiohttp import ClientSession
+from aiohttp import ClientError, ClientResponseError, ClientSession
 from json import dumps
 
+# Fetched repository JSON, its expiry time and ETag, keyed by endpoint url
+_cache: dict[str, tuple[str, float, str | None]] = {}
+_lock = asyncio.Lock()
+
+
+class _RateLimitError(ClientResponseError):
+    """GitHub rejected a request because the rate limit is exhausted.
+
+    Attributes:
+        retry_after: Seconds until the rate limit resets.
+    """
+
+    def __init__(self, *args, retry_after: float, **kwargs) -> None:
+        """Initialize the error.
+
+        Args:
+            retry_after: Seconds until the rate limit resets.
+            *args: Positional arguments for ``ClientResponseError``.
+            **kwargs: Keyword arguments for ``ClientResponseError``.
+        """
+        super().__init__(*args, **kwargs)
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(value: str) -> float:
+    """Convert a ``Retry-After`` header into seconds to wait.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP-date.
+
+    Returns:
+        Seconds until the retry time, or 0.0 if the value is malformed.
+    """
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return 0.0
+
+
+async def fetch_project_repos_cached(url: str, ttl_seconds: float) -> str:
+    """Return ``fetch_project_repos`` output, refetching at most once per TTL.
+
+    Concurrent callers on an expired entry wait for a single fetch
+    instead of each calling the GitHub API. An expired entry is
+    revalidated with its ETag, so an unchanged list costs a bodiless 304
+    that does not count against the rate limit. While the rate limit is
+    exhausted the cached list is kept until it resets, and if a refresh
+    fails the cached list is served for another TTL.
+
+    Args:
+        url: API endpoint url for fetching user repos.
+        ttl_seconds: Seconds a fetched result is reused.
+
+    Returns:
+        The JSON-formatted repository list.
+
+    Raises:
+        RuntimeError: If the GITHUB_TOKEN environment variable is not set.
+        aiohttp.ClientError: If the first fetch fails.
+    """
+    entry = _cache.get(url)
+    if entry is not None and entry[1] > time.monotonic():
+        return entry[0]
+    async with _lock:
+        entry = _cache.get(url)
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
+        etag = entry[2] if entry is not None else None
+        try:
+            repos, new_etag, retry_after = await _fetch_project_repos(url, etag)
+        except (ClientError, asyncio.TimeoutError) as exc:
+            if entry is None:
+                raise
+            retry_after = exc.retry_after if isinstance(exc, _RateLimitError) else 0.0
+            repos, new_etag = None, etag
+        if repos is None:
+            repos, new_etag = entry[0], etag
+        _cache[url] = (repos, time.monotonic() + max(ttl_seconds, retry_after), new_etag)
+        return repos
+
+
 async def fetch_project_repos(url: str) -> str:
     """
     Fetch Sanath's GitHub repositories, sorted by creation date (desc), for project linking.
@@ -20,6 +108,29 @@ async def fetch_project_repos(url: str) -> str:
         RuntimeError: If the GITHUB_TOKEN environment variable is not set.
         aiohttp.ClientResponseError: If the GitHub API request fails.
     """
+    repos, _, _ = await _fetch_project_repos(url)
+    return repos
+
+
+async def _fetch_project_repos(
+    url: str, etag: str | None = None
+) -> tuple[str | None, str | None, float]:
+    """Fetch the repository list, optionally as a conditional request.
+
+    Args:
+        url: API endpoint url for fetching user repos.
+        etag: ETag of a previously fetched list to revalidate.
+
+    Returns:
+        The JSON-formatted repository list, or None if GitHub answered
+        304 Not Modified, then the response ETag and the seconds until
+        the rate limit resets if it is exhausted, else 0.
+
+    Raises:
+        RuntimeError: If the GITHUB_TOKEN environment variable is not set.
+        _RateLimitError: If GitHub rejected the request for the rate limit.
+        aiohttp.ClientResponseError: If the GitHub API request fails.
+    """
     token = getenv("GITHUB_TOKEN")
     if not token:
         raise RuntimeError("GITHUB_TOKEN environment variable not set")
@@ -29,6 +140,8 @@ async def fetch_project_repos(url: str) -> str:
         "Authorization": f"Bearer {token}",
         "X-GitHub-Api-Version": "2022-11-28",
     }
+    if etag is not None:
+        headers["If-None-Match"] = etag
     params = {
         "sort": "created",
         "direction": "desc",
@@ -36,8 +149,26 @@ async def fetch_project_repos(url: str) -> str:
 
     async with ClientSession(headers=headers) as session:
         async with session.get(url, params=params) as response:
+            retry_after = 0.0
+            if response.headers.get("X-RateLimit-Remaining") == "0":
+                reset_at = float(response.headers.get("X-RateLimit-Reset", 0))
+                retry_after = max(0.0, reset_at - time.time())
+            elif "Retry-After" in response.headers:
+                retry_after = _parse_retry_after(response.headers["Retry-After"])
+            if response.status == 304:
+                return None, etag, retry_after
+            if response.status in (403, 429) and retry_after > 0:
+                raise _RateLimitError(
+                    response.request_info,
+                    response.history,
+                    status=response.status,
+                    message=response.reason or "",
+                    headers=response.headers,
+                    retry_after=retry_after,
+                )
             response.raise_for_status()
             repos = await response.json()
+            new_etag = response.headers.get("ETag")
     
     filtered_response = [
         {
@@ -47,4 +178,4 @@ async def fetch_project_repos(url: str) -> str:
         }
         for repo in repos
     ]
-    return dumps(filtered_response)
\ No newline at end of file
+    return dumps(filtered_response), new_etag, retry_after
\ No newline at end of file
@@ -2,14 +2,89 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 
+from langchain_core.documents import Document
 from langchain_core.vectorstores import VectorStoreRetriever
 from sentence_transformers import CrossEncoder
 
 from src.config import RetrievalConfig
 
 
+class QueryCache:
+    """Thread-safe LRU cache of retrieved documents with a time-to-live.
+
+    Keys are search queries normalized to lowercase with collapsed
+    whitespace, so trivially different phrasings share an entry.
+
+    Attributes:
+        max_size: Maximum number of cached queries.
+        ttl_seconds: Seconds an entry stays valid.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of cached queries.
+            ttl_seconds: Seconds an entry stays valid.
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, list[Document]]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Normalize a search query into a cache key.
+
+        Args:
+            query: The search query string.
+
+        Returns:
+            Lowercased query with runs of whitespace collapsed.
+        """
+        return " ".join(query.lower().split())
+
+    def get(self, query: str) -> list[Document] | None:
+        """Return cached documents for a query if present and fresh.
+
+        Args:
+            query: The search query string.
+
+        Returns:
+            The cached documents, or None on a miss.
+        """
+        key = self.normalize(query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, documents = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return documents
+
+    def put(self, query: str, documents: list[Document]) -> None:
+        """Store documents for a query, evicting the least recently used entry.
+
+        Args:
+            query: The search query string.
+            documents: Documents retrieved for the query.
+        """
+        key = self.normalize(query)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, documents)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
 @dataclass
 class RetrievalDeps:
     """Dependencies for retrieval operations.
@@ -18,10 +93,12 @@ class RetrievalDeps:
         retriever: Vector store retriever for similarity search.
         reranker: Cross-encoder model for reranking results.
         config: Retrieval configuration.
+        query_cache: Cache of retrieved documents per search query.
     """
     retriever: VectorStoreRetriever
     reranker: CrossEncoder
     config: RetrievalConfig
+    query_cache: QueryCache
 
 
 async def retrieve_and_rerank(
@@ -37,7 +114,10 @@ async def retrieve_and_rerank(
         List of reranked document texts sorted by relevance score.
     """
     # Retrieve initial results
-    retrieved_results = await deps.retriever.ainvoke(search_query)
+    retrieved_results = deps.query_cache.get(search_query)
+    if retrieved_results is None:
+        retrieved_results = await deps.retriever.ainvoke(search_query)
+        deps.query_cache.put(search_query, retrieved_results)
 
     # Prepare input for reranker
     reranker_input = [
@@ -72,4 +152,5 @@ def create_retrieval_deps(
         Configured RetrievalDeps instance.
     """
     reranker = CrossEncoder(config.reranker_model)
-    return RetrievalDeps(retriever=retriever, reranker=reranker, config=config)
\ No newline at end of file
+    query_cache = QueryCache(config.query_cache_size, config.query_cache_ttl)
+    return RetrievalDeps(retriever=retriever, reranker=reranker, config=config, query_cache=query_cache)
\ No newline at end of file
@@ -79,7 +79,16 @@ async def get_instagram_posts(account_info_url: str, media_url: str, account_inf
 
 
 async def get_youtube_videos():
-    """Fetch YouTube videos with async batch processing."""
+    """Fetch YouTube videos without blocking the event loop.
+
+    The YouTube client is synchronous, so the calls run in a worker thread
+    and can overlap with other tool calls such as the Instagram fetch.
+    """
+    return await asyncio.to_thread(_fetch_youtube_videos)
+
+
+def _fetch_youtube_videos() -> str:
+    """Fetch YouTube videos with batch processing."""
     access_token = getenv("YOUTUBE_ACCESS_TOKEN")
     refresh_token = getenv("YOUTUBE_REFRESH_TOKEN")
     client_id = getenv("YOUTUBE_CLIENT_ID")
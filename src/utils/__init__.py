@@ -0,0 +1,8 @@
+"""Shared utilities for the agents."""
+
+from src.utils.instructions import get_instructions, preload_instructions, prompt_cache_key
+from src.utils.openai_client import get_async_openai
+from src.utils.orchestrator_cache import OrchestratorCache
+from src.utils.tracing import trace_output
+
+__all__ = ["OrchestratorCache", "get_async_openai", "get_instructions", "preload_instructions", "prompt_cache_key", "trace_output"]
\ No newline at end of file
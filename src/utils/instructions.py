@@ -0,0 +1,127 @@
+"""Cached loading of agent system instructions."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from functools import lru_cache
+from os import getenv
+from pathlib import Path
+
+from langfuse import get_client
+
+# Seconds before a cached prompt is refreshed in the background
+_TTL_SECONDS = 300.0
+# Seconds to wait for langfuse before falling back to the local file
+_FETCH_TIMEOUT_SECONDS = 1.0
+
+_langfuse_configured = bool(getenv("LANGFUSE_PUBLIC_KEY") and getenv("LANGFUSE_SECRET_KEY"))
+# Monotonic time until which langfuse is skipped after a failed fetch
+_langfuse_retry_at = 0.0
+
+_cache: dict[str, tuple[str, float]] = {}
+_refreshing: set[str] = set()
+_background_tasks: set[asyncio.Task[None]] = set()
+_lock = asyncio.Lock()
+
+
+def _fetch_instructions(langfuse_key: str, instructions_path: Path) -> str:
+    """Load system instructions from langfuse or file.
+
+    Langfuse is skipped when it is not configured, and for one TTL after
+    a failed fetch, so an outage costs at most one timeout per TTL.
+
+    Args:
+        langfuse_key: Name of the prompt in langfuse.
+        instructions_path: Local file used if langfuse is unavailable.
+
+    Returns:
+        System instructions text.
+    """
+    global _langfuse_retry_at
+    if _langfuse_configured and time.monotonic() >= _langfuse_retry_at:
+        try:
+            return get_client().get_prompt(
+                langfuse_key, fetch_timeout_seconds=_FETCH_TIMEOUT_SECONDS, max_retries=0
+            ).prompt
+        except Exception:
+            _langfuse_retry_at = time.monotonic() + _TTL_SECONDS
+    return instructions_path.read_text(encoding="utf-8")
+
+
+def preload_instructions(langfuse_key: str, instructions_path: Path) -> None:
+    """Fetch system instructions ahead of the first request.
+
+    Blocks the caller, so it is meant for startup before the event loop
+    serves traffic. A failed langfuse fetch here also sets the back-off,
+    so the other agents go straight to their local files.
+
+    Args:
+        langfuse_key: Name of the prompt in langfuse.
+        instructions_path: Local file used if langfuse is unavailable.
+    """
+    text = _fetch_instructions(langfuse_key, instructions_path)
+    _cache[langfuse_key] = (text, time.monotonic() + _TTL_SECONDS)
+
+
+async def _refresh(langfuse_key: str, instructions_path: Path) -> None:
+    """Reload a cached prompt in a worker thread.
+
+    Args:
+        langfuse_key: Name of the prompt in langfuse.
+        instructions_path: Local file used if langfuse is unavailable.
+    """
+    try:
+        text = await asyncio.to_thread(_fetch_instructions, langfuse_key, instructions_path)
+        _cache[langfuse_key] = (text, time.monotonic() + _TTL_SECONDS)
+    finally:
+        _refreshing.discard(langfuse_key)
+
+
+@lru_cache(maxsize=32)
+def prompt_cache_key(instructions: str) -> str:
+    """Derive a stable OpenAI prompt cache key from instructions text.
+
+    Requests sharing the key are routed to the same prompt cache, and a
+    changed prompt gets a fresh key.
+
+    Args:
+        instructions: System instructions text.
+
+    Returns:
+        Hex SHA-1 digest of the instructions.
+    """
+    return hashlib.sha1(instructions.encode("utf-8")).hexdigest()
+
+
+async def get_instructions(langfuse_key: str, instructions_path: Path) -> str:
+    """Return system instructions, loading them on first use.
+
+    Later calls return the cached text immediately. Once it is older than
+    the TTL, it is still returned while a background task fetches a
+    fresh copy.
+
+    Args:
+        langfuse_key: Name of the prompt in langfuse.
+        instructions_path: Local file used if langfuse is unavailable.
+
+    Returns:
+        System instructions text.
+    """
+    entry = _cache.get(langfuse_key)
+    if entry is None:
+        async with _lock:
+            entry = _cache.get(langfuse_key)
+            if entry is None:
+                text = await asyncio.to_thread(_fetch_instructions, langfuse_key, instructions_path)
+                _cache[langfuse_key] = (text, time.monotonic() + _TTL_SECONDS)
+                return text
+
+    text, expires_at = entry
+    if expires_at <= time.monotonic() and langfuse_key not in _refreshing:
+        _refreshing.add(langfuse_key)
+        task = asyncio.get_running_loop().create_task(_refresh(langfuse_key, instructions_path))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+    return text
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""Process-wide AsyncOpenAI client."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import httpx
+from openai import AsyncOpenAI
+
+
+@lru_cache(maxsize=1)
+def get_async_openai() -> AsyncOpenAI:
+    """Return the shared AsyncOpenAI client, creating it on first use.
+
+    The client multiplexes requests over HTTP/2 with a pool sized for
+    concurrent agent calls, and keeps idle connections warm between
+    user turns.
+
+    Returns:
+        The shared AsyncOpenAI client.
+    """
+    return AsyncOpenAI(
+        http_client=httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100, keepalive_expiry=60),
+            timeout=httpx.Timeout(600.0, connect=5.0),
+        )
+    )
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""Exact-match cache of orchestrator routing decisions."""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import Any
+
+import orjson
+
+from src.models.schemas import OrchestratorRoute
+
+
+class OrchestratorCache:
+    """LRU cache of routes keyed by the conversation text and instructions.
+
+    Message text is compared after case folding and collapsing
+    whitespace, so only differences that cannot change the route are
+    ignored. Questions that are merely similar never share a route.
+
+    Routes are stored as plain dicts and validated into a fresh model on
+    every hit, so callers never share a mutable cached instance.
+
+    Attributes:
+        max_size: Maximum number of cached routes.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of cached routes.
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+    @staticmethod
+    def make_key(conversation: list[dict[str, str]], instructions_key: str) -> str:
+        """Hash a normalized conversation with the instructions it is routed under.
+
+        Args:
+            conversation: List of user queries and generated responses over the past.
+            instructions_key: Hash identifying the orchestrator instructions.
+
+        Returns:
+            Hex SHA-256 digest.
+        """
+        normalized = [
+            {**message, "content": " ".join(message.get("content", "").casefold().split())}
+            for message in conversation
+        ]
+        digest = hashlib.sha256(orjson.dumps(normalized, option=orjson.OPT_SORT_KEYS))
+        digest.update(instructions_key.encode("ascii"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> OrchestratorRoute | None:
+        """Return the cached route for a key.
+
+        Args:
+            key: Key from ``make_key``.
+
+        Returns:
+            The cached route, or None on a miss.
+        """
+        data = self._entries.get(key)
+        if data is None:
+            return None
+        self._entries.move_to_end(key)
+        return OrchestratorRoute.model_validate(data)
+
+    def put(self, key: str, route: OrchestratorRoute) -> None:
+        """Store a route, evicting the least recently used entry if full.
+
+        Args:
+            key: Key from ``make_key``.
+            route: Routing decision to cache.
+        """
+        self._entries[key] = route.model_dump()
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
\ No newline at end of file
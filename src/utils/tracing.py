@@ -0,0 +1,31 @@
+"""Helpers for keeping traced tool outputs small."""
+
+from __future__ import annotations
+
+import hashlib
+import random
+from os import getenv
+
+# Fraction of tool spans that keep their full output
+_SAMPLE_RATE = float(getenv("TRACE_SAMPLE_RATE", "0.1"))
+# Characters of output kept on the remaining spans
+_MAX_CHARS = 2048
+
+
+def trace_output(output: str) -> str:
+    """Shorten a tool output before it is attached to a langfuse span.
+
+    A sampled fraction of spans keeps the full text. The rest keep its
+    head plus a short digest, so identical outputs can still be matched
+    across traces.
+
+    Args:
+        output: Full tool output.
+
+    Returns:
+        The output itself, or its truncated head followed by a digest.
+    """
+    if len(output) <= _MAX_CHARS or random.random() < _SAMPLE_RATE:
+        return output
+    digest = hashlib.sha256(output.encode("utf-8")).hexdigest()[:8]
+    return f"{output[:_MAX_CHARS]}...<{len(output)} chars, sha256={digest}>"
\ No newline at end of file
@@ -1,6 +1,8 @@
 """Vector store and document processing modules."""
 
+from src.vector_store.embeddings import BatchedEmbeddings
 from src.vector_store.processor import FileProcessor
+from src.vector_store.splitter import MarkdownHeaderSplitter
 from src.vector_store.store import ProjectsVectorStore
 
-__all__ = ["FileProcessor", "ProjectsVectorStore"]
\ No newline at end of file
+__all__ = ["BatchedEmbeddings", "FileProcessor", "MarkdownHeaderSplitter", "ProjectsVectorStore"]
\ No newline at end of file
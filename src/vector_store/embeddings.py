@@ -0,0 +1,99 @@
+"""Embeddings wrapper that coalesces concurrent query embeddings."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+
+from langchain_core.embeddings import Embeddings
+
+
+class BatchedEmbeddings(Embeddings):
+    """Embeddings that batch concurrent query calls into one request.
+
+    Queries passed to ``embed_query`` within a short window are sent
+    together through the wrapped model's ``embed_documents``, so parallel
+    retrieval tool calls share one embeddings round trip. Batching happens
+    on the sync path because ``QdrantVectorStore`` has no native async
+    search: ``retriever.ainvoke`` runs ``similarity_search`` in an executor
+    thread, which calls ``embed_query``. All other methods delegate to the
+    wrapped model unchanged.
+
+    Attributes:
+        embeddings: The wrapped embeddings model.
+        max_batch_size: Number of queued queries that triggers an immediate flush.
+        window: Seconds to wait for more queries before flushing.
+    """
+
+    def __init__(self, embeddings: Embeddings, max_batch_size: int = 64, window: float = 0.005) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            embeddings: The embeddings model to wrap.
+            max_batch_size: Number of queued queries that triggers an immediate flush.
+            window: Seconds to wait for more queries before flushing.
+        """
+        self.embeddings = embeddings
+        self.max_batch_size = max_batch_size
+        self.window = window
+        self._pending: list[tuple[str, Future[list[float]]]] = []
+        self._lock = threading.Lock()
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed documents with the wrapped model."""
+        return self.embeddings.embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a query as part of the next batch.
+
+        The caller that opens a batch waits one window for concurrent
+        queries from other threads, then sends them all in one request.
+
+        Args:
+            text: Query text.
+
+        Returns:
+            The query embedding.
+        """
+        future: Future[list[float]] = Future()
+        with self._lock:
+            self._pending.append((text, future))
+            size = len(self._pending)
+        if size >= self.max_batch_size:
+            self._flush()
+        elif size == 1:
+            time.sleep(self.window)
+            self._flush()
+        return future.result()
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed documents asynchronously with the wrapped model."""
+        return await self.embeddings.aembed_documents(texts)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        """Embed a query as part of the next batch without blocking the event loop.
+
+        Args:
+            text: Query text.
+
+        Returns:
+            The query embedding.
+        """
+        return await asyncio.to_thread(self.embed_query, text)
+
+    def _flush(self) -> None:
+        """Send all queued queries as one embeddings request."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return
+        try:
+            vectors = self.embeddings.embed_documents([text for text, _ in batch])
+        except Exception as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        for (_, future), vector in zip(batch, vectors):
+            future.set_result(vector)
\ No newline at end of file
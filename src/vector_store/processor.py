@@ -2,19 +2,141 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
+import os
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
 from glob import glob
+from multiprocessing import get_context
 from pathlib import Path
+from queue import Queue
+from threading import Lock, Thread
 from typing import Any
 
+import orjson
 from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.pipeline_options import EasyOcrOptions, PdfPipelineOptions
 from docling.document_converter import DocumentConverter, PdfFormatOption
 from langchain_core.documents import Document
-from langchain_text_splitters import MarkdownHeaderTextSplitter
+from pypdfium2 import PdfDocument
 
 from src.config import ProcessorConfig
+from src.vector_store.splitter import MarkdownHeaderSplitter
+
+
+def _create_pipeline_options(num_threads: int, do_ocr: bool) -> PdfPipelineOptions:
+    """Create the docling pipeline options used for PDF conversion.
+    
+    Args:
+        num_threads: Number of threads docling may use for a single document.
+        do_ocr: Whether to run EasyOCR on the document pages.
+        
+    Returns:
+        Configured PdfPipelineOptions.
+    """
+    return PdfPipelineOptions(
+        do_ocr=do_ocr,
+        ocr_options=EasyOcrOptions(lang=["en"]),
+        do_table_structure=False,
+        accelerator_options=AcceleratorOptions(
+            num_threads=num_threads,
+            device=AcceleratorDevice.CUDA,
+        ),
+    )
+
+
+def _create_pdf_converter(num_threads: int, do_ocr: bool) -> DocumentConverter:
+    """Create a PDF-to-Markdown document converter.
+    
+    Args:
+        num_threads: Number of threads docling may use for a single document.
+        do_ocr: Whether to run EasyOCR on the document pages.
+        
+    Returns:
+        Configured DocumentConverter for PDF input.
+    """
+    return DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_options=_create_pipeline_options(num_threads, do_ocr)
+            )
+        }
+    )
+
+
+_CONVERTERS: dict[bool, DocumentConverter] = {}
+_CONVERTERS_LOCK = Lock()
+
+
+def _get_pdf_converter(num_threads: int, do_ocr: bool) -> DocumentConverter:
+    """Return the process-wide PDF converter, creating it on first use.
+    
+    Args:
+        num_threads: Number of threads docling may use for a single document.
+        do_ocr: Whether to run EasyOCR on the document pages.
+        
+    Returns:
+        Shared DocumentConverter for the requested OCR mode.
+    """
+    converter = _CONVERTERS.get(do_ocr)
+    if converter is None:
+        with _CONVERTERS_LOCK:
+            converter = _CONVERTERS.get(do_ocr)
+            if converter is None:
+                converter = _create_pdf_converter(num_threads, do_ocr)
+                _CONVERTERS[do_ocr] = converter
+    return converter
+
+
+def _init_worker(num_threads: int) -> None:
+    """Load the docling layout models once when a worker starts.
+    
+    Only the text-layer converter is preloaded. The OCR converter is built
+    by ``_get_pdf_converter`` the first time a scanned PDF reaches the
+    worker, so text-only corpora never load the EasyOCR models.
+    
+    Args:
+        num_threads: Number of threads docling may use for a single document.
+    """
+    _get_pdf_converter(num_threads, do_ocr=False).initialize_pipeline(InputFormat.PDF)
+
+
+def _convert_pdf(file_path: str, num_threads: int, do_ocr: bool) -> str:
+    """Convert a PDF to Markdown text in a worker process.
+    
+    Each worker owns its converters because docling models are not safe
+    to share across processes.
+    
+    Args:
+        file_path: Path to the PDF file.
+        num_threads: Number of threads docling may use for the document.
+        do_ocr: Whether to run EasyOCR on the document pages.
+        
+    Returns:
+        Markdown representation of the PDF.
+    """
+    result = _get_pdf_converter(num_threads, do_ocr).convert(file_path)
+    return result.document.export_to_markdown()
+
+
+@dataclass
+class _LoadedFile:
+    """A file moving through the document build pipeline.
+    
+    Attributes:
+        path: Path to the source file.
+        markdown: Markdown text, or None while a PDF still needs conversion.
+        cache_path: Conversion cache entry to populate for a PDF.
+        do_ocr: Whether the PDF needs OCR to be converted.
+        conversion: Pending PDF conversion in the process pool.
+    """
+    path: Path
+    markdown: str | None
+    cache_path: Path | None = None
+    do_ocr: bool = True
+    conversion: Future[str] | None = None
 
 
 class FileProcessor:
@@ -25,7 +147,7 @@ class FileProcessor:
         files: List of file paths matching the input glob.
         metadata_config: Per-file metadata from configuration.
         splitter: Markdown header-based text splitter.
-        pdf_converter: PDF to Markdown converter.
+        cache_stats: Hit and miss counts of the PDF conversion cache.
     """
 
     def __init__(self, config: ProcessorConfig) -> None:
@@ -35,35 +157,214 @@ class FileProcessor:
             config: Processor configuration.
         """
         self.config = config
-        self.files = glob(str(config.input_glob))
+        self.files = self._list_files(str(config.input_glob))
         self.metadata_config = self._load_metadata_config()
+        self._prefixes = self._build_prefixes()
         self.splitter = self._create_markdown_splitter()
-        self.pdf_converter = self._create_pdf_converter()
+        self.cache_stats: Counter[str] = Counter()
+        self._pipeline_hashes = {
+            do_ocr: hashlib.sha256(
+                _create_pipeline_options(config.num_threads, do_ocr).model_dump_json().encode()
+            ).hexdigest()
+            for do_ocr in (True, False)
+        }
 
     def build_documents(self) -> list[Document]:
         """Build LangChain documents from all input files.
         
+        Files flow through three stages connected by bounded queues, so
+        reading and hashing the next file, converting PDFs, and splitting
+        finished documents overlap:
+        
+        1. load: read Markdown files and look up PDFs in the conversion cache.
+        2. convert: dispatch cache misses to a process pool sized so that
+           workers times docling threads roughly matches the number of cores.
+        3. split: chunk and enrich documents in the calling thread.
+        
+        Returns:
+            List of processed and chunked documents with enriched metadata.
+            
+        Raises:
+            Exception: Any error raised while loading or converting a file.
+        """
+        load_queue: Queue[_LoadedFile | None] = Queue(maxsize=self.config.queue_size)
+        split_queue: Queue[_LoadedFile | None] = Queue(maxsize=self.config.queue_size)
+        errors: list[BaseException] = []
+
+        num_workers = max(1, (os.cpu_count() or 1) // self.config.num_threads)
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.config.num_threads,),
+        ) as pool:
+            stages = [
+                Thread(target=self._load_stage, args=(load_queue, errors), daemon=True),
+                Thread(target=self._convert_stage, args=(load_queue, split_queue, pool, errors), daemon=True),
+            ]
+            for stage in stages:
+                stage.start()
+            documents = self._split_stage(split_queue)
+            for stage in stages:
+                stage.join()
+
+        if errors:
+            raise errors[0]
+        if self.cache_stats:
+            print(
+                f"PDF conversion cache: {self.cache_stats['hit']} hits, "
+                f"{self.cache_stats['miss']} misses"
+            )
+        return documents
+
+    def _load_stage(self, out_queue: Queue[_LoadedFile | None], errors: list[BaseException]) -> None:
+        """Read input files and resolve cached PDF conversions.
+        
+        Args:
+            out_queue: Queue receiving loaded files, terminated by ``None``.
+            errors: Collector for an error that stops the stage.
+        """
+        try:
+            for file_path in self.files:
+                path = Path(file_path)
+                if path.suffix == ".pdf":
+                    do_ocr = self._needs_ocr(path)
+                    cache_path = self._cache_path(path, do_ocr)
+                    if cache_path.exists():
+                        self.cache_stats["hit"] += 1
+                        out_queue.put(_LoadedFile(path, cache_path.read_text(encoding="utf-8")))
+                    else:
+                        self.cache_stats["miss"] += 1
+                        out_queue.put(_LoadedFile(path, None, cache_path, do_ocr))
+                else:
+                    out_queue.put(_LoadedFile(path, self._to_markdown(path)))
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            out_queue.put(None)
+
+    def _convert_stage(
+        self,
+        in_queue: Queue[_LoadedFile | None],
+        out_queue: Queue[_LoadedFile | None],
+        pool: ProcessPoolExecutor,
+        errors: list[BaseException],
+    ) -> None:
+        """Dispatch PDFs without a cached conversion to the process pool.
+        
+        Args:
+            in_queue: Queue of loaded files, terminated by ``None``.
+            out_queue: Queue receiving files with Markdown or a pending
+                conversion, terminated by ``None``.
+            pool: Process pool running the PDF conversions.
+            errors: Collector for an error that stops the stage.
+        """
+        try:
+            while (loaded := in_queue.get()) is not None:
+                if loaded.markdown is None:
+                    loaded.conversion = pool.submit(
+                        _convert_pdf, str(loaded.path), self.config.num_threads, loaded.do_ocr
+                    )
+                out_queue.put(loaded)
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            out_queue.put(None)
+
+    def _split_stage(self, in_queue: Queue[_LoadedFile | None]) -> list[Document]:
+        """Split loaded files as they become available.
+        
+        Files whose conversion is still running are set aside so that
+        ready files are never blocked behind a slow PDF.
+        
+        Args:
+            in_queue: Queue of loaded files, terminated by ``None``.
+            
         Returns:
             List of processed and chunked documents with enriched metadata.
         """
         documents: list[Document] = []
-        for file_path in self.files:
-            documents.extend(self._process_file(file_path))
+        converting: dict[Future[str], _LoadedFile] = {}
+        while (loaded := in_queue.get()) is not None:
+            if loaded.conversion is None:
+                documents.extend(self._process_markdown(loaded.markdown or "", loaded.path.name))
+            else:
+                converting[loaded.conversion] = loaded
+        for future in as_completed(converting):
+            loaded = converting[future]
+            markdown_text = future.result()
+            if loaded.cache_path is not None:
+                self._write_cache(loaded.cache_path, markdown_text)
+            documents.extend(self._process_markdown(markdown_text, loaded.path.name))
         return documents
 
-    def _process_file(self, file_path: str) -> list[Document]:
-        """Process a single file into chunked documents with metadata.
+    def _needs_ocr(self, path: Path) -> bool:
+        """Check whether a PDF lacks an embedded text layer.
+        
+        Only the first few pages are probed; PDFs whose text can be
+        extracted directly are converted without OCR.
+        
+        Args:
+            path: Path to the PDF file.
+            
+        Returns:
+            True if the probed pages contain too little text to skip OCR.
+        """
+        pdf = PdfDocument(path)
+        try:
+            num_chars = 0
+            for index in range(min(len(pdf), self.config.ocr_probe_pages)):
+                page = pdf[index]
+                textpage = page.get_textpage()
+                num_chars += len(textpage.get_text_range().strip())
+                textpage.close()
+                page.close()
+        finally:
+            pdf.close()
+        return num_chars < self.config.ocr_min_chars
+
+    def _cache_path(self, path: Path, do_ocr: bool) -> Path:
+        """Return the conversion cache entry for a PDF.
+        
+        The key combines the file contents with the pipeline options, so an
+        edited PDF or a changed conversion setup both miss the cache.
+        
+        Args:
+            path: Path to the PDF file.
+            do_ocr: Whether the PDF is converted with OCR.
+            
+        Returns:
+            Path of the cached Markdown file.
+        """
+        content_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+        key = hashlib.sha256(f"{content_hash}:{self._pipeline_hashes[do_ocr]}".encode()).hexdigest()
+        return self.config.cache_dir / f"{key}.md"
+
+    @staticmethod
+    def _write_cache(cache_path: Path, markdown_text: str) -> None:
+        """Atomically write a converted document to the cache.
+        
+        Args:
+            cache_path: Destination cache entry.
+            markdown_text: Converted Markdown text.
+        """
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(markdown_text, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+
+    def _process_markdown(self, markdown_text: str, file_name: str) -> list[Document]:
+        """Split Markdown text into chunked documents with metadata.
         
         Args:
-            file_path: Path to the file to process.
+            markdown_text: Markdown content of the source file.
+            file_name: Name of the source file for metadata lookup.
             
         Returns:
             List of processed Document objects with enriched content and metadata.
         """
-        path = Path(file_path)
-        markdown_text = self._to_markdown(path)
         docs = self.splitter.split_text(markdown_text)
-        return self._enrich_documents(docs, path.name)
+        return self._enrich_documents(docs, file_name)
 
     def _enrich_documents(
         self, docs: list[Document], file_name: str
@@ -76,27 +377,21 @@ class FileProcessor:
             
         Returns:
             Enriched documents with prepended metadata in page_content and
-            updated metadata dictionary.
+            updated metadata dictionary, including the source file name.
         """
         metadata = self.metadata_config.get(file_name, {})
-
-        # Build prefix from file name, tools, and skills
-        prefix_parts = [
-            file_name,
-            *metadata.get("tools_used", []),
-            *metadata.get("skills", []),
-        ]
-        prefix = " ".join(prefix_parts)
+        prefix = self._prefixes.get(file_name) or f"{file_name}\n"
 
         # Enrich each document
         for doc in docs:
-            doc.page_content = f"{prefix}\n{doc.page_content}"
-            doc.metadata.update(metadata)
+            doc.page_content = prefix + doc.page_content
+            doc.metadata = {**metadata, **doc.metadata, "source": file_name}
 
         return docs
 
-    def _to_markdown(self, path: Path) -> str:
-        """Convert a file to Markdown text.
+    @staticmethod
+    def _to_markdown(path: Path) -> str:
+        """Read a non-PDF file as Markdown text.
         
         Args:
             path: Path to the input file.
@@ -107,58 +402,64 @@ class FileProcessor:
         Raises:
             ValueError: If the file format is unsupported.
         """
-        if path.suffix == ".pdf":
-            result = self.pdf_converter.convert(str(path))
-            return result.document.export_to_markdown()
-        elif path.suffix == ".md":
+        if path.suffix == ".md":
             return path.read_text(encoding="utf-8")
         else:
             raise ValueError(f"Unsupported file format: {path.suffix}")
 
+    @staticmethod
+    def _list_files(pattern: str) -> list[str]:
+        """List the input files matching a glob pattern.
+        
+        A plain ``<dir>/*`` pattern is served with a single ``os.scandir``
+        call; any other pattern falls back to ``glob``.
+        
+        Args:
+            pattern: Glob pattern for input files.
+            
+        Returns:
+            Matching file paths, excluding hidden entries.
+        """
+        directory, _, name = pattern.rpartition("/")
+        if name == "*" and directory and not any(c in directory for c in "*?["):
+            with os.scandir(directory) as entries:
+                return [entry.path for entry in entries if not entry.name.startswith(".")]
+        return glob(pattern)
+
     def _load_metadata_config(self) -> dict[str, dict[str, Any]]:
         """Load per-file metadata configuration.
         
         Returns:
             Mapping of filename to metadata dictionary.
         """
-        with open(self.config.config_path, encoding="utf-8") as f:
-            return json.load(f)
+        return orjson.loads(self.config.config_path.read_bytes())
+
+    def _build_prefixes(self) -> dict[str, str]:
+        """Build the content prefix for every configured file.
+        
+        Returns:
+            Mapping of filename to its newline-terminated prefix made of the
+            file name, tools, and skills.
+        """
+        return {
+            file_name: " ".join(
+                [file_name, *metadata.get("tools_used", []), *metadata.get("skills", [])]
+            ) + "\n"
+            for file_name, metadata in self.metadata_config.items()
+        }
 
     @staticmethod
-    def _create_markdown_splitter() -> MarkdownHeaderTextSplitter:
+    def _create_markdown_splitter() -> MarkdownHeaderSplitter:
         """Create a Markdown header-based text splitter.
         
         Returns:
-            Configured MarkdownHeaderTextSplitter.
+            Configured MarkdownHeaderSplitter.
         """
-        return MarkdownHeaderTextSplitter(
+        return MarkdownHeaderSplitter(
             headers_to_split_on=[
                 ("#", "Header 1"),
                 ("##", "Header 2"),
                 ("###", "Header 3"),
                 ("####", "Header 4"),
             ],
-            strip_headers=False,
-        )
-
-    def _create_pdf_converter(self) -> DocumentConverter:
-        """Create a PDF-to-Markdown document converter.
-        
-        Returns:
-            Configured DocumentConverter for PDF input.
-        """
-        return DocumentConverter(
-            format_options={
-                InputFormat.PDF: PdfFormatOption(
-                    pipeline_options=PdfPipelineOptions(
-                        do_ocr=True,
-                        ocr_options=EasyOcrOptions(lang=["en"]),
-                        do_table_structure=False,
-                        accelerator_options=AcceleratorOptions(
-                            num_threads=self.config.num_threads,
-                            device=AcceleratorDevice.CUDA,
-                        ),
-                    )
-                )
-            }
         )
\ No newline at end of file
@@ -2,21 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
+import math
+from collections import Counter
+from uuid import NAMESPACE_OID, uuid5
+
+import httpx
+import tiktoken
+from langchain_core.documents import Document
 from langchain_openai import OpenAIEmbeddings
 from langchain_qdrant import QdrantVectorStore
+from openai import AsyncOpenAI
 from qdrant_client import QdrantClient
 from qdrant_client.http.exceptions import ResponseHandlingException
+from qdrant_client.models import Distance, PointStruct, VectorParams
 
 from src.config import ProcessorConfig, VectorStoreConfig
+from src.vector_store.embeddings import BatchedEmbeddings
 from src.vector_store.processor import FileProcessor
 
+# Embedding requests multiplex over HTTP/2, so one warm connection serves
+# every concurrent batch.
+_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+
 
 class ProjectsVectorStore:
     """Wrapper for creating or loading a Qdrant-backed vector store.
     
     Attributes:
         config: Vector store configuration.
-        embedding: OpenAI embeddings model.
+        embedding: OpenAI embeddings model that batches concurrent search queries.
     """
 
     def __init__(
@@ -32,7 +47,15 @@ class ProjectsVectorStore:
         """
         self.config = config
         self.processor_config = processor_config
-        self.embedding = OpenAIEmbeddings(model=config.embedding_model)
+        self.embedding = BatchedEmbeddings(
+            OpenAIEmbeddings(
+                model=config.embedding_model,
+                http_client=httpx.Client(http2=True, limits=_HTTP_LIMITS),
+                http_async_client=httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS),
+            ),
+            max_batch_size=config.query_batch_size,
+            window=config.query_batch_window,
+        )
 
     def get_vector_store(self) -> QdrantVectorStore:
         """Load an existing vector store or create a new one if it does not exist.
@@ -56,7 +79,8 @@ class ProjectsVectorStore:
             Newly created QdrantVectorStore.
             
         Raises:
-            ValueError: If processor_config is not provided.
+            ValueError: If processor_config is not provided or the input
+                files produce no documents.
         """
         if self.processor_config is None:
             raise ValueError(
@@ -65,13 +89,159 @@ class ProjectsVectorStore:
 
         processor = FileProcessor(self.processor_config)
         documents = processor.build_documents()
+        if not documents:
+            raise ValueError(
+                f"No documents found for {self.processor_config.input_glob}; nothing to index"
+            )
 
-        return QdrantVectorStore.from_documents(
-            documents=documents,
-            embedding=self.embedding,
+        texts = [doc.page_content for doc in documents]
+        vectors = asyncio.run(self._aembed_all(texts))
+        self._upload(documents, vectors)
+
+        return self._load()
+
+    def _make_batches(self, inputs: list[list[int]]) -> list[list[list[int]]]:
+        """Pack tokenized inputs into as few embedding requests as possible.
+
+        Batches are bounded both by input count and by the per-request
+        token budget.
+
+        Args:
+            inputs: Token ids of each input.
+
+        Returns:
+            Consecutive batches of inputs, in input order.
+        """
+        batches: list[list[list[int]]] = []
+        batch: list[list[int]] = []
+        batch_tokens = 0
+        for tokens in inputs:
+            if batch and (
+                len(batch) >= self.config.embedding_batch_size
+                or batch_tokens + len(tokens) > self.config.embedding_batch_max_tokens
+            ):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(tokens)
+            batch_tokens += len(tokens)
+        if batch:
+            batches.append(batch)
+        return batches
+
+    async def _aembed_all(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts with concurrent batched requests.
+
+        At most ``embedding_concurrency`` batch requests are in flight at
+        once, so network latency overlaps across batches. Texts are sent
+        as token ids. A text longer than ``embedding_max_input_tokens`` is
+        embedded in consecutive windows whose vectors are averaged,
+        weighted by window length, and renormalized, as
+        ``OpenAIEmbeddings`` does.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            One embedding vector per input text, in input order.
+        """
+        encoding = tiktoken.get_encoding("cl100k_base")
+        max_input = self.config.embedding_max_input_tokens
+        windows: list[list[int]] = []
+        owners: list[int] = []
+        for index, tokens in enumerate(encoding.encode_batch(texts)):
+            for start in range(0, max(len(tokens), 1), max_input):
+                windows.append(tokens[start:start + max_input])
+                owners.append(index)
+
+        semaphore = asyncio.Semaphore(self.config.embedding_concurrency)
+
+        http_client = httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS)
+        async with AsyncOpenAI(http_client=http_client) as client:
+            async def embed(batch: list[list[int]]) -> list[list[float]]:
+                async with semaphore:
+                    response = await client.embeddings.create(
+                        model=self.config.embedding_model, input=batch
+                    )
+                return [item.embedding for item in response.data]
+
+            results = await asyncio.gather(
+                *(embed(batch) for batch in self._make_batches(windows))
+            )
+        window_vectors = [vector for batch_vectors in results for vector in batch_vectors]
+
+        grouped: list[list[tuple[list[float], int]]] = [[] for _ in texts]
+        for owner, window, vector in zip(owners, windows, window_vectors):
+            grouped[owner].append((vector, len(window)))
+        return [self._combine_windows(parts) for parts in grouped]
+
+    @staticmethod
+    def _combine_windows(parts: list[tuple[list[float], int]]) -> list[float]:
+        """Merge the window embeddings of one text into a single vector.
+
+        Args:
+            parts: Embedding and token count of each window, in order.
+
+        Returns:
+            The token-weighted average of the windows, normalized to unit length.
+        """
+        if len(parts) == 1:
+            return parts[0][0]
+        total = sum(weight for _, weight in parts)
+        average = [
+            sum(vector[i] * weight for vector, weight in parts) / total
+            for i in range(len(parts[0][0]))
+        ]
+        norm = math.sqrt(sum(value * value for value in average))
+        return [value / norm for value in average]
+
+    def _upload(
+        self, documents: list[Document], vectors: list[list[float]]
+    ) -> None:
+        """Create the collection and upload documents with precomputed vectors.
+
+        Payloads use the same layout as ``QdrantVectorStore`` so the
+        collection can be loaded with ``from_existing_collection``. Point
+        IDs are derived from the source file, the chunk's position in it
+        and its content, so re-uploading the same chunks overwrites them
+        instead of adding duplicates, while identical chunks from different
+        places are kept apart. The upload waits until the points are
+        applied, so the store is never served half-indexed.
+
+        Args:
+            documents: Documents to store.
+            vectors: Embedding vector for each document.
+        """
+        chunk_index: Counter[str] = Counter()
+        point_ids: list[str] = []
+        for doc in documents:
+            source = doc.metadata.get("source", "")
+            key = f"{source}\x00{chunk_index[source]}\x00{doc.page_content}"
+            point_ids.append(uuid5(NAMESPACE_OID, key).hex)
+            chunk_index[source] += 1
+
+        client = QdrantClient(url=self.config.url, port=self.config.port)
+        client.create_collection(
             collection_name=self.config.collection_name,
-            url=self.config.url,
-            port=self.config.port,
+            vectors_config=VectorParams(
+                size=len(vectors[0]), distance=Distance.COSINE
+            ),
+        )
+        client.upload_points(
+            collection_name=self.config.collection_name,
+            points=[
+                PointStruct(
+                    id=point_id,
+                    vector=vector,
+                    payload={
+                        QdrantVectorStore.CONTENT_KEY: doc.page_content,
+                        QdrantVectorStore.METADATA_KEY: doc.metadata,
+                    },
+                )
+                for point_id, doc, vector in zip(point_ids, documents, vectors)
+            ],
+            batch_size=self.config.upload_batch_size,
+            parallel=self.config.upload_parallel,
+            wait=True,
         )
 
     def _load(self) -> QdrantVectorStore: